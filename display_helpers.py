@@ -0,0 +1,257 @@
+# Drawing and image helpers for the GC9A01 round display, split out of
+# main_app.py so they can be shipped precompiled. To build the native .mpy
+# for the RP2040 (Cortex-M0+):
+#
+#     mpy-cross -X emit=native -march=armv6m display_helpers.py
+#
+# Copy display_helpers.mpy to the Pico alongside main_app.py - the import
+# resolves to the .mpy, skipping the boot-time compile of these kernels.
+
+import gc
+import micropython
+
+# Images up to this many bytes are blitted in a single transfer; anything
+# bigger (e.g. full 240x240 screens) still streams in chunks.
+FULL_BLIT_THRESHOLD = 16384
+
+# === Color helpers ===
+# Native-compiled: called from the inner loops of the drawing helpers,
+# so skip the bytecode dispatch overhead per call.
+@micropython.native
+def color565(r, g, b):
+    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+
+@micropython.native
+def rgb565_to_rgb888(color):
+    r = ((color >> 11) & 0x1F) << 3
+    g = ((color >> 5) & 0x3F) << 2
+    b = (color & 0x1F) << 3
+    return r, g, b
+
+@micropython.native
+def rgb888_to_rgb565(r, g, b):
+    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+
+def replace_color_rgb565(data, from_color, to_color):
+    out = bytearray(len(data))
+    for i in range(0, len(data), 2):
+        color = (data[i] << 8) | data[i+1]
+        if color == from_color:
+            color = to_color
+        out[i] = color >> 8
+        out[i+1] = color & 0xFF
+    return out
+
+def display_raw_image_in_chunks(display, filepath, x, y, width, height, scale=1, smooth=False, chunk_rows=8, clear_color=0x0000, clear=True, collect_per_chunk=False):
+    """
+    Streams a raw RGB565 image to the GC9A01 display in chunks using blit_buffer(),
+    with optional integer scaling and sharpening (sharpening applied after scaling).
+
+    Args:
+        display:     Initialized GC9A01 display object.
+        filepath:    Path to the .raw RGB565 image file.
+        x, y:        Top-left position on the screen to draw the image.
+        width:       Width of the image in pixels.
+        height:      Height of the image in pixels.
+        scale:       Integer scaling factor (default: 1 = no scale).
+        smooth:      Add optional smoothing after scaling
+        chunk_rows:  Number of source image rows per chunk (default: 8).
+        clear_color: Optional background color (default: black).
+        clear:       If True, clear the screen before drawing.
+        collect_per_chunk: If True, run gc.collect() after every chunk
+                     (only worth it for scale > 1 with smoothing).
+    """
+
+    def smooth_chunk(data, width, height, threshold=10):
+        out = bytearray(len(data))
+
+        for row in range(height):
+            for col in range(width):
+                center_idx = (row * width + col) * 2
+                center = (data[center_idx] << 8) | data[center_idx + 1]
+                r_sum, g_sum, b_sum, count = 0, 0, 0, 0
+
+                for dy in (-1, 0, 1):
+                    ny = row + dy
+                    if ny < 0 or ny >= height:
+                        continue
+                    for dx in (-1, 0, 1):
+                        nx = col + dx
+                        if nx < 0 or nx >= width:
+                            continue
+                        neighbor_idx = (ny * width + nx) * 2
+                        neighbor = (data[neighbor_idx] << 8) | data[neighbor_idx + 1]
+
+                        # Use your existing helper for RGB conversion
+                        r1, g1, b1 = rgb565_to_rgb888(center)
+                        r2, g2, b2 = rgb565_to_rgb888(neighbor)
+                        dist = abs(r1 - r2) + abs(g1 - g2) + abs(b1 - b2)
+
+                        if dist <= threshold:
+                            r_sum += r2
+                            g_sum += g2
+                            b_sum += b2
+                            count += 1
+
+                if count > 0:
+                    avg_r = r_sum // count
+                    avg_g = g_sum // count
+                    avg_b = b_sum // count
+                    smoothed = rgb888_to_rgb565(avg_r, avg_g, avg_b)
+                else:
+                    smoothed = center
+
+                out[center_idx] = smoothed >> 8
+                out[center_idx + 1] = smoothed & 0xFF
+
+        return out
+
+    bytes_per_pixel = 2
+    row_bytes = width * bytes_per_pixel
+
+    if clear:
+        display.fill(clear_color)
+
+
+    try:
+        with open(filepath, "rb") as f:
+            # Small unscaled images: one read + one blit avoids the SPI
+            # command framing overhead of many small transfers.
+            total = height * row_bytes
+            if scale == 1 and total <= FULL_BLIT_THRESHOLD:
+                display.blit_buffer(f.read(total), x, y, width, height)
+                return
+
+            # Preallocate the scaling buffer once at full chunk size; the
+            # last (possibly shorter) chunk reuses a slice of it.
+            scaled_width = width * scale
+            scaled_buf = bytearray(scaled_width * chunk_rows * scale * 2) if scale > 1 else None
+
+            for row_start in range(0, height, chunk_rows):
+                actual_rows = min(chunk_rows, height - row_start)
+                chunk_size = actual_rows * row_bytes
+                chunk_data = f.read(chunk_size)
+
+                if scale == 1:
+                    display.blit_buffer(chunk_data, x, y + row_start, width, actual_rows)
+                else:
+                    scaled_height = actual_rows * scale
+                    scaled_chunk = memoryview(scaled_buf)[:scaled_width * scaled_height * 2]
+
+                    for row in range(actual_rows):
+                        for col in range(width):
+                            src_idx = (row * width + col) * 2
+                            pixel_hi = chunk_data[src_idx]
+                            pixel_lo = chunk_data[src_idx + 1]
+
+                            for dy in range(scale):
+                                dest_row = row * scale + dy
+                                for dx in range(scale):
+                                    dest_col = col * scale + dx
+                                    dest_idx = (dest_row * scaled_width + dest_col) * 2
+                                    scaled_chunk[dest_idx] = pixel_hi
+                                    scaled_chunk[dest_idx + 1] = pixel_lo
+
+                    if smooth:
+                        scaled_chunk = smooth_chunk(scaled_chunk, scaled_width, scaled_height)
+
+                    display.blit_buffer(scaled_chunk, x, y + row_start * scale, scaled_width, scaled_height)
+
+                if collect_per_chunk:
+                    gc.collect()
+
+        # One collection for the whole image instead of a stop-the-world
+        # pass every few rows
+        gc.collect()
+
+    except Exception as e:
+        print("Error displaying image:", e)
+
+def display_1bit_image_in_chunks(display, path, x0, y0, width, height, fg_color, bg_color):
+    row_bytes = width // 8  # bytes per row in 1-bit format
+    with open(path, "rb") as f:
+        for y in range(height):
+            row = f.read(row_bytes)
+            buf = bytearray(width * 2)  # one line of RGB565
+            for x in range(width):
+                byte_index = x // 8
+                bit_index = 7 - (x % 8)
+                bit = (row[byte_index] >> bit_index) & 1
+                color = fg_color if bit else bg_color
+                i = x * 2
+                buf[i] = color >> 8
+                buf[i + 1] = color & 0xFF
+            display.blit_buffer(buf, x0, y0 + y, width, 1)
+
+def draw_sparse_grayscale(display, filepath):
+    # Read 1365 whole (x, y, gray) records at a time into one reused
+    # buffer - flash FAT reads are far faster in 4 KB streams than in
+    # per-record 3-byte reads, and readinto never allocates. The size is
+    # a multiple of 3 so no record straddles a chunk boundary.
+    buf = bytearray(4095)
+    with open(filepath, "rb") as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            for i in range(0, n - n % 3, 3):
+                gray = buf[i + 2]
+                # Convert grayscale to RGB565 (approximate)
+                rgb565 = ((gray & 0xF8) << 8) | ((gray & 0xFC) << 3) | (gray >> 3)
+                display.pixel(buf[i], buf[i + 1], rgb565)
+
+def draw_rle_image(display, filepath, x=0, y=0):
+    """
+    Draw a run-length-encoded RGB565 image.
+
+    File layout: a 4-byte header (width u16 LE, height u16 LE) followed
+    by (count u8, color u16 LE) run pairs covering the image row-major;
+    runs may cross row boundaries. For artwork with large solid regions
+    (like the boot logo) this is several times smaller than a raw dump
+    and decodes in one sequential pass - runs are expanded into a one-row
+    scratch buffer and each completed row goes out as a single blit.
+    Encode offline by run-length-compressing the .raw RGB565 dump and
+    prepending the size header.
+    """
+    buf = bytearray(4095)  # multiple of the 3-byte pair size
+    with open(filepath, "rb") as f:
+        hdr = f.read(4)
+        width = hdr[0] | (hdr[1] << 8)
+        height = hdr[2] | (hdr[3] << 8)
+        row = bytearray(width * 2)
+        col = 0        # pixels filled in the current row
+        rows_done = 0
+        while rows_done < height:
+            n = f.readinto(buf)
+            if not n:
+                break
+            for i in range(0, n - n % 3, 3):
+                count = buf[i]
+                lo = buf[i + 1]  # color stored LE; panel wants hi byte first
+                hi = buf[i + 2]
+                while count:
+                    run = width - col
+                    if run > count:
+                        run = count
+                    j = col * 2
+                    for _ in range(run):
+                        row[j] = hi
+                        row[j + 1] = lo
+                        j += 2
+                    col += run
+                    count -= run
+                    if col == width:
+                        display.blit_buffer(row, x, y + rows_done, width, 1)
+                        col = 0
+                        rows_done += 1
+                        if rows_done == height:
+                            return
+
+def draw_sparse_1bit(display, filepath, color=0x0000):
+    with open(filepath, "rb") as f:
+        while True:
+            bytes_read = f.read(2)
+            if not bytes_read or len(bytes_read) < 2:
+                break
+            x, y = bytes_read
+            display.pixel(x, y, color)
@@ -6,10 +6,8 @@ from machine import Pin, SPI
 import math
 import ntptime
 import gc
-import uio
 import sys
 import uasyncio
-import hashlib
 from phew import access_point, connect_to_wifi, is_connected_to_wifi, dns, server
 from phew.template import render_template
 from phew import logging
@@ -17,7 +15,11 @@ from phew.server import Response
 import ujson as json
 import os
 import ure  # MicroPython’s regex module
+import urandom
+import array
+import framebuf
 import _thread
+import micropython
 
 # Imports for round color tft display
 import gc9a01py as gc9a01
@@ -25,10 +27,32 @@ import vga1_8x16 as font_sm
 import vga1_16x16 as font_lg
 import vga1_16x32 as font_huge
 
+# Drawing/image kernels live in display_helpers so they can be shipped as a
+# native-emit .mpy (see the build note at the top of that module)
+from display_helpers import (
+    color565, rgb565_to_rgb888, rgb888_to_rgb565, replace_color_rgb565,
+    display_raw_image_in_chunks, display_1bit_image_in_chunks,
+    draw_sparse_grayscale, draw_sparse_1bit, draw_rle_image,
+)
+
 # === Software Version ===
 __version__ = "1.0.1"
 # ========================
 
+# Set True for memory/parse diagnostics over USB serial. print() is
+# synchronous on MicroPython, so these cost real milliseconds per refresh;
+# const() lets the compiler drop the gated blocks entirely.
+DEBUG = micropython.const(False)
+
+# RGB565 values for the handful of colors used on nearly every redraw.
+# const() folds them into the bytecode, so hot call sites skip the
+# color565() call (and its small-int result allocation) entirely.
+BLACK = micropython.const(0x0000)   # color565(0, 0, 0)
+WHITE = micropython.const(0xFFFF)   # color565(255, 255, 255)
+LBLUE = micropython.const(0xAEDC)   # color565(173, 216, 230)
+YELLOW = micropython.const(0xFFE0)  # color565(255, 255, 0)
+CREAM = micropython.const(0xFFF1)   # color565(255, 254, 140)
+
 # === Definitons for Wifi Setup and Access ===
 AP_NAME = "P&L Forecaster"
 AP_DOMAIN = "plforecaster.net"
@@ -42,9 +66,6 @@ SYNC_INTERVAL = 3600 # Sync to NTP time server every hour
 WEATH_INTERVAL = 1800 # Update forecast every 30 mins
 last_sync = 0
 last_weather_update = 0
-press_time = None
-long_press_triggered = False
-start_update_requested = False
 # continue_requested = False
 init_complete = False      # Indicate whether all init is completed (lat lon, gmt offset, weather)
 gmt_offset_complete = False
@@ -82,7 +103,9 @@ TIMEZONE_OFFSETS = {
 }
 
 # === Define timezone ===
-gmt_offset = 0   # Initialze gmt offset
+# Kept in integer seconds: the RP2040 has no FPU, so per-call float math
+# in the time path would hit slow soft-float routines.
+gmt_offset_secs = 0   # Initialze gmt offset (seconds east of UTC)
 
 # === SPI and Display Init ===
 WIDTH = 240
@@ -95,10 +118,6 @@ display = gc9a01.GC9A01(
     reset=Pin(12, Pin.OUT)
 )
 
-# === Color helper ===
-def color565(r, g, b):
-    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-    
 # === Other GPIO Setup ===
 onboard_led = machine.Pin("LED", machine.Pin.OUT)
 setup_sw = machine.Pin(5, machine.Pin.IN, machine.Pin.PULL_UP)
@@ -144,16 +163,34 @@ def safe_mkdirs(path):
             pass  # Directory exists
 
 # === AP and Wi-Fi Setup ===
+# Warm up the json module once at import time - on MicroPython the first
+# loads() is slow until a dumps() has run.
+json.dumps(None)
+
+# Cache of the parsed settings dict so repeated load_settings calls don't
+# re-read and re-parse the file unless it actually changed on flash.
+_SETTINGS_CACHE = None
+_SETTINGS_MTIME = None
+
 def load_settings():
+    global _SETTINGS_CACHE, _SETTINGS_MTIME
+
     # Check if file is missing
-    if SETTINGS_FILE not in os.listdir():
+    try:
+        mtime = os.stat(SETTINGS_FILE)[8]
+    except OSError:
         print("Settings file is missing.")
         return "missing", None, "No Settings Found"
 
     try:
-        # Try to parse JSON
-        with open(SETTINGS_FILE, "r") as f:
-            settings = json.load(f)
+        # Reuse the cached parse if the file hasn't changed, else re-parse
+        if _SETTINGS_CACHE is not None and mtime == _SETTINGS_MTIME:
+            settings = _SETTINGS_CACHE
+        else:
+            with open(SETTINGS_FILE, "r") as f:
+                settings = json.load(f)
+            _SETTINGS_CACHE = settings
+            _SETTINGS_MTIME = mtime
 
         # Validate WiFi SSID (Required Parameter)
         ssid = settings.get("ssid", "").strip()
@@ -193,29 +230,31 @@ def load_settings():
             print("Invalid settings: Must provide ZIP code or valid lat/lon")
             return "invalid", None, "Bad ZIP or lat/lon"
         
-        # Validate timezone info
+        # Validate timezone info - single lookup per key
         tz = settings.get("timezone")
+        use_dst = settings.get("use_dst")
+        manual_offset = settings.get("manual_offset", "")
         if not tz:
             print("Invalid settings: Missing timezone")
             return "invalid", None, "Timezone missing"
 
         if tz == "manual":
             try:
-                mo = settings.get("manual_offset", "")
-                if mo == "":
+                if manual_offset == "":
                     print("Invalid settings: manual_offset not provided")
                     return "invalid", None, "Need Timezone offset"
-                float(mo)  # Just check it's a valid float
+                float(manual_offset)  # Just check it's a valid float
             except ValueError:
                 print("Invalid settings: Timezone offset not a number")
                 return "invalid", None, "Timezone offset not a number"
 
-        print(f"Timezone loaded: {tz}, DST enabled: {settings.get('use_dst')}, manual_offset: {settings.get('manual_offset')}")
+        print(f"Timezone loaded: {tz}, DST enabled: {use_dst}, manual_offset: {manual_offset}")
 
         return "valid", settings, "Settings valid"
 
     except Exception as e:
 
+        import uio  # error path only - keep it off the boot heap
         buf = uio.StringIO()
         sys.print_exception(e, buf)
 #        logging.exception("Settings file error:\n" + buf.getvalue())
@@ -225,17 +264,31 @@ def load_settings():
 def save_settings(settings):
     """
     Save the settings dictionary to the settings.json file.
-    Overwrites the file with new data.
+    Overwrites the file with new data and updates the in-memory cache.
     """
+    global _SETTINGS_CACHE, _SETTINGS_MTIME
     try:
         with open(SETTINGS_FILE, "w") as f:
             json.dump(settings, f)
+        _SETTINGS_CACHE = settings
+        try:
+            _SETTINGS_MTIME = os.stat(SETTINGS_FILE)[8]
+        except OSError:
+            _SETTINGS_MTIME = None
         print("Settings saved successfully.")
         return True
     except Exception as e:
         print("Failed to save settings:", e)
         return False
 
+def _rm_if_exists(path):
+    # Shared remove-if-present for the update cleanup paths; a missing
+    # file is the expected case, not an error
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
 def serve_config_page(setup_mode: bool):
     def response_gen():
         with open(f"{AP_TEMPLATE_PATH}/config_settings.html", "r") as f:
@@ -253,12 +306,12 @@ def machine_reset():
 
 def setup_mode():
     print("Entering setup mode...")
-    display.fill(color565(0, 0, 0))
+    display.fill(BLACK)
     center_lgtext("Setup Mode",40, color565(0, 255, 0))
     center_smtext("On Phone or Computer", 80)
     center_smtext("Open WiFi/Network settings", 100)
     center_smtext("and select network:", 120)
-    center_lgtext("P&L Forecaster", 140, color565(255, 255, 0))
+    center_lgtext("P&L Forecaster", 140, YELLOW)
     
     def load_settings():
         try:
@@ -280,13 +333,13 @@ def setup_mode():
         global client_connected
         if not client_connected:
             print("Client browser contacted /")
-            display.fill(color565(0, 0, 0))
+            display.fill(BLACK)
             center_lgtext("WiFi", 40, color565(0, 255, 0))
             center_lgtext("Connected!", 60, color565(0, 255, 0))
             center_smtext("Opening Config Page...", 100)
             center_smtext(f"If page does not load,", 120)
             center_smtext(f"open browser to:", 140)
-            center_smtext(f"http://{AP_DOMAIN}", 160, color565(255, 255, 0))
+            center_smtext(f"http://{AP_DOMAIN}", 160, YELLOW)
             client_connected = True
             
         # Redirect if host header is not the expected AP domain
@@ -302,7 +355,7 @@ def setup_mode():
 #        with open(SETTINGS_FILE, "w") as f:
 #            json.dump(request.form, f)
             
-#        display.fill(color565(0, 0, 0))
+#        display.fill(BLACK)
 #        center_lgtext("Settings", 60, color565(0, 255, 0))
 #        center_lgtext("Saved!", 80, color565(0, 255, 0))
 #        center_smtext("Restarting...", 120)
@@ -322,21 +375,6 @@ def setup_mode():
 
 #        # Return the generator to the server — Phew will stream the response
 #        return response_gen()
-    
-    def load_settings():
-        try:
-            with open(SETTINGS_FILE, "r") as f:
-                return json.load(f)
-        except Exception:
-            return {
-                "location_source": "zip",
-                "zip": "",
-                "lat": "",
-                "lon": "",
-                "timezone": "",
-                "use_dst": False,
-                "manual_offset": ""
-            }
 
     def settings_get_handler(request):
         print("GET /settings received (setup mode)")
@@ -363,7 +401,7 @@ def setup_mode():
                 json.dump(current_settings, f)
 
             # Feedback on OLED
-            display.fill(color565(0, 0, 0))
+            display.fill(BLACK)
             center_lgtext("Settings", 60, color565(0, 255, 0))
             center_lgtext("Saved!", 80, color565(0, 255, 0))
             center_smtext("Restarting...", 120)
@@ -402,11 +440,11 @@ def start_update_mode():
     ip = network.WLAN(network.STA_IF).ifconfig()[0]
     print(f"start_update_mode: got IP = {ip}")
     
-    display.fill(color565(0, 0, 0))
+    display.fill(BLACK)
     center_lgtext("Software",60,color565(0, 255, 0))
     center_lgtext("Update Mode",80,color565(0, 255, 0))
     center_smtext("Enter", 100)
-    center_smtext(f"http://{ip}", 120,color565(255, 255, 0))
+    center_smtext(f"http://{ip}", 120,YELLOW)
     center_smtext("into browser", 140)
 
     def ap_version(request):
@@ -430,6 +468,7 @@ def start_update_mode():
             return Response(f"Error reading checksums: {e}", status=400)
 
     async def finalize_handler(request):
+        import hashlib  # only needed while applying a software update
         failed = []
         # Validate checksums
         for filename, expected_hash in expected_checksums.items():
@@ -449,27 +488,21 @@ def start_update_mode():
 
         if failed:
             for filename in expected_checksums:
-                try:
-                    os.remove(filename)
-                except:
-                    pass
+                _rm_if_exists(filename)
             return Response("Update failed:\n" + "\n".join([f"{f}: {reason}" for f, reason in failed]), status=500)
         
         # Rename all .new files except main_app.py.new
         for filename in expected_checksums:
             if filename.endswith(".new") and filename != "main_app.py.new":
                 final_name = filename[:-4]
-                try:
-                    os.remove(final_name) # Safe overwrite
-                except:
-                    pass
+                _rm_if_exists(final_name) # Safe overwrite
                 try:
                     os.rename(filename, final_name)
                 except Exception as e:
                     return Response(f"Rename failed: {filename} -> {final_name}: {e}", status=500)
 
         # Optional OLED display
-        display.fill(color565(0, 0, 0))
+        display.fill(BLACK)
         center_lgtext("Update", 60, color565(0, 255, 0))
         center_lgtext("Complete!", 80, color565(0, 255, 0))
         center_smtext("Rebooting on OK", 100)
@@ -482,7 +515,7 @@ def start_update_mode():
         print("Software updated, OK clicked, restarting device...")
 
         # Display restarting received message    
-        display.fill(color565(0, 0, 0))
+        display.fill(BLACK)
         center_lgtext("New Version", 60, color565(0, 255, 0))
         center_lgtext("Saved!", 80, color565(0, 255, 0))
         center_smtext("Restarting device...", 120)
@@ -527,26 +560,28 @@ def start_update_mode():
         try:
             print(f"[UPLOAD] Starting write to {filepath}")
             total_written = 0
-            chunk_size = 1024
+            chunk_size = 4096  # 4 KB reads: fewer async round trips, better flash write batching
 
             with open(filepath, "wb") as f:
                 while True:
                     chunk = await request.read_body_chunk(chunk_size)
                     if chunk is None:
-                        await uasyncio.sleep(0.05)
+                        # Short yield only - don't stall the loop waiting for data
+                        await uasyncio.sleep_ms(5)
                         continue
                     if chunk == b'':
                         # EOF: end of upload
                         print("[UPLOAD] Received EOF")
                         break
                     f.write(chunk)
-                    total_written += len(chunk)
-                    print(f"[UPLOAD] Wrote chunk of {len(chunk)} bytes (total so far: {total_written})")
+                    chunk_len = len(chunk)
+                    total_written += chunk_len
+                    print(f"[UPLOAD] Wrote chunk of {chunk_len} bytes (total so far: {total_written})")
             
             print(f"[UPLOAD] Finished writing {total_written} bytes to {filepath}")
             
             # Display file received message    
-            display.fill(color565(0, 0, 0))
+            display.fill(BLACK)
             center_lgtext("New Version", 60, color565(0, 255, 0))
             center_lgtext("Received!", 80, color565(0, 255, 0))
             center_smtext(f"{total_written}B to ", 100)
@@ -612,7 +647,7 @@ def start_update_mode():
                 json.dump(current_settings, f)
                 
             # Show success and reboot
-            display.fill(color565(0, 0, 0))
+            display.fill(BLACK)
             center_lgtext("Settings", 60, color565(0, 255, 0))
             center_lgtext("Saved!", 80, color565(0, 255, 0))
             center_smtext("Restarting...", 120)
@@ -658,34 +693,61 @@ def start_update_mode():
 #        time.sleep(0.1)
 
 # === Handler for button presses during operation ===
+# Button state lives in a preallocated array so the IRQ handler never
+# allocates on the heap: [press_time_ms, long_press_triggered, update_requested]
+_SW_STATE = array.array('l', [0, 0, 0])
+
+@micropython.native
 def setup_sw_handler(pin):
-    global press_time, long_press_triggered, start_update_requested
+    t = time.ticks_ms()
     if pin.value() == 0:  # Falling edge: button pressed
-        press_time = time.ticks_ms()
-        long_press_triggered = False
+        _SW_STATE[0] = t
+        _SW_STATE[1] = 0
     else:  # Rising edge: button released
-        if press_time is not None:
-            duration = time.ticks_diff(time.ticks_ms(), press_time)
-            if duration >= 5000:  # 5 seconds
-                long_press_triggered = True
-                print("Long press detected!")
+        # 0 doubles as "not pressed" - ticks_ms() never lands on exactly 0
+        # in practice, so no separate sentinel check is needed
+        pt = _SW_STATE[0]
+        if pt:
+            if time.ticks_diff(t, pt) >= 5000:  # 5 seconds
+                _SW_STATE[1] = 1
                 # Set flag for main loop to poll and to call start_update_mode
-                start_update_requested = True
-            press_time = None
+                _SW_STATE[2] = 1
+            _SW_STATE[0] = 0
 # Set up input as irq triggered, falling edge            
 setup_sw.irq(trigger=machine.Pin.IRQ_FALLING | machine.Pin.IRQ_RISING, handler=setup_sw_handler)
 
 # === Time Funcitions =====
-def sync_time(max_retries=3, delay=3):
+last_successful_sync = 0  # time.time() of last good NTP sync (0 = never)
+_sync_jitter = 0          # up-to-10 s early margin so we don't hit NTP on the exact hour
+
+def sync_time(max_retries=3, delay=1):
+    global last_successful_sync, _sync_jitter
+
+    # Skip the network trip entirely if we synced recently - RTC drift over
+    # an hour is negligible compared to a blocking NTP round trip. The
+    # jitter shrinks the window (never grows it): the caller only invokes
+    # us once elapsed >= SYNC_INTERVAL, so adding jitter on top would make
+    # the guard skip that call and silently double the interval.
+    if last_successful_sync and time.time() - last_successful_sync < SYNC_INTERVAL - abs(_sync_jitter):
+        return True
+
+    # Don't block on retries if the link is down
+    if not network.WLAN(network.STA_IF).isconnected():
+        print("WiFi not connected, skipping NTP sync")
+        return False
+
     for attempt in range(1, max_retries + 1):
         try:
             print("Syncing time with NTP server...")
             ntptime.settime()
             print("Time sync successful.")
+            last_successful_sync = time.time()
+            _sync_jitter = urandom.getrandbits(8) % 11  # 0..10 s early
             return True
         except Exception as e:
             print(f"Failed to sync time (attempt {attempt}): {e}")
-            time.sleep(delay)
+            if attempt < max_retries:
+                time.sleep(delay * (2 ** (attempt - 1)))  # 1s, 2s, 4s backoff
     print("Time sync failed after retries.")
     return False
         
@@ -712,7 +774,7 @@ def is_us_dst_now():
     return dst_start <= now < dst_end
 
 def apply_gmt_offset_from_settings(settings):
-    global gmt_offset, gmt_offset_complete
+    global gmt_offset_secs, gmt_offset_complete
 
     tz = settings.get("timezone")
     use_dst = settings.get("use_dst", False)
@@ -720,37 +782,31 @@ def apply_gmt_offset_from_settings(settings):
 
     if tz == "Manual":
         try:
-            gmt_offset = float(manual_offset_raw)
-            print(f"Using manual GMT offset: {gmt_offset} hours")
+            # Parse the float once here; everything downstream is integer math
+            gmt_offset_secs = int(float(manual_offset_raw) * 3600)
+            print(f"Using manual GMT offset: {gmt_offset_secs / 3600} hours")
         except Exception:
-            gmt_offset = 0
+            gmt_offset_secs = 0
             print("Invalid manual offset; defaulting to GMT+0")
     else:
         base_offset = TIMEZONE_OFFSETS.get(tz)
         if base_offset is not None:
-            gmt_offset = base_offset
+            gmt_offset_secs = base_offset * 3600
             if use_dst and is_us_dst_now():
-                gmt_offset += 1
-                print(f"{tz} is in DST, adjusted GMT offset: {gmt_offset} hours")
+                gmt_offset_secs += 3600
+                print(f"{tz} is in DST, adjusted GMT offset: {gmt_offset_secs // 3600} hours")
             else:
-                print(f"{tz}, standard GMT offset: {gmt_offset} hours")
+                print(f"{tz}, standard GMT offset: {gmt_offset_secs // 3600} hours")
         else:
-            gmt_offset = 0
+            gmt_offset_secs = 0
             print(f"Unknown timezone '{tz}'; defaulting to GMT+0")
 
     gmt_offset_complete = True
 
 def localtime_with_offset():
 #    Return local time.struct_time adjusted from UTC using timezone offset and DST.
-    
-#    now = time.gmtime()
-#    month = now[1]
-#    mday = now[2]
-#    weekday = now[6]  # 0 = Monday, 6 = Sunday
-    now = time.mktime(time.gmtime())
-    offset = gmt_offset or 0
-    local_timestamp = now + int(offset * 3600)
-    return time.localtime(local_timestamp)
+#    Pure integer add - no per-call float op on the soft-float Cortex-M0+.
+    return time.localtime(time.mktime(time.gmtime()) + gmt_offset_secs)
 
 def format_12h_time(t):
     hour = t[3]
@@ -769,19 +825,21 @@ def format_12h_time(t):
     return "{:2d}:{:02d} {}".format(hour_12, t[4], am_pm)
 
 def update_time_only(time_str):
-    display.fill_rect(0, 40, 240, 20, color565(0, 0, 0))  # Clear just time area
+    display.fill_rect(0, 40, 240, 20, BLACK)  # Clear just time area
     center_lgtext(time_str, 40, color565(0, 255, 255))
     
 def update_date_only(date_str):
-    display.fill_rect(0, 20, 240, 20, color565(0, 0, 0))  # Clear just date area
-    center_lgtext(date_str, 20, color565(255, 255, 255))
+    display.fill_rect(0, 20, 240, 20, BLACK)  # Clear just date area
+    center_lgtext(date_str, 20, WHITE)
     
-def fetch_sunrise_sunset(lat, lon, gmt_offset_hours):
+def fetch_sunrise_sunset(lat, lon, gmt_offset_secs):
     url = f"https://api.sunrise-sunset.org/json?lat={lat}&lng={lon}&formatted=0"
     try:
         r = urequests.get(url)
-        data = r.json()
-        r.close()
+        try:
+            data = r.json()
+        finally:
+            r.close()  # always release the socket, even on a parse error
         if data["status"] != "OK":
             print("Sunrise-Sunset API error:", data["status"])
             return None, None
@@ -793,9 +851,8 @@ def fetch_sunrise_sunset(lat, lon, gmt_offset_hours):
         sunset_epoch = iso8601_to_epoch(sunset_utc)
 
         # Apply offset for local time (including DST)
-        offset_sec = int(gmt_offset_hours * 3600)
-        sunrise_local = time.localtime(sunrise_epoch + offset_sec)
-        sunset_local = time.localtime(sunset_epoch + offset_sec)
+        sunrise_local = time.localtime(sunrise_epoch + gmt_offset_secs)
+        sunset_local = time.localtime(sunset_epoch + gmt_offset_secs)
 
         return sunrise_local, sunset_local
 
@@ -827,11 +884,53 @@ def format_sun_time(t):
         hour_12 = 12
     return f"{hour_12}:{minute:02d} {am_pm}"
 
+# === Forecast Icon cache ====
+# Icons are stored on flash already in the RGB565 byte order blit_buffer
+# consumes, so caching is a straight read - no per-frame conversion needed.
+_ICON_CACHE = {}
+ICON_BYTES = 64 * 64 * 2  # 64x64 RGB565 icons
+# Stop preloading while this much heap is still free - the Wi-Fi/TLS
+# bring-up right after boot needs ~30-40 KB of contiguous buffers, and a
+# cache pinned all the way to MemoryError can't be collected back.
+ICON_RAM_RESERVE = micropython.const(50 * 1024)
+
+def preload_icon_cache():
+    """Read all weather icons into RAM once at boot so weather refreshes
+    blit straight from the cache instead of re-reading flash each cycle."""
+    try:
+        files = os.listdir("icons")
+    except OSError:
+        print("No icons directory found, skipping icon preload")
+        return
+    for name in files:
+        if not name.endswith("_rgb565.raw"):
+            continue  # skip logo/sparse files, only cache blit-ready icons
+        if gc.mem_free() < ICON_RAM_RESERVE + ICON_BYTES:
+            print("Low RAM, stopping icon preload at", len(_ICON_CACHE))
+            break
+        path = "icons/" + name
+        try:
+            with open(path, "rb") as f:
+                _ICON_CACHE[path] = f.read(ICON_BYTES)
+        except OSError as e:
+            print(f"Failed to preload {path}: {e}")
+    print(f"Preloaded {len(_ICON_CACHE)} icons")
+    gc.collect()
+
 # === Forecast Icon selection ====
+# Last (simplified forecast, day flag, filename) - the display cycle redraws
+# the same icon every few seconds, so this hits almost every call.
+_ICON_NAME_CACHE = (None, None, None)
+
 def get_icon_filename(simplified_now, day):
-    
+    global _ICON_NAME_CACHE
+
     if not simplified_now:
         simplified_now = "No Forecast"
+
+    if simplified_now == _ICON_NAME_CACHE[0] and day == _ICON_NAME_CACHE[1]:
+        return _ICON_NAME_CACHE[2]
+
     f = simplified_now.lower()
     print(f"simplified forecast: {f}")
 
@@ -865,173 +964,11 @@ def get_icon_filename(simplified_now, day):
         icon_filename = "icons/smiley_rgb565.raw" if day else "icons/smiley_sleep_rgb565.raw"
     
     print(f"Icon filename selected: {icon_filename}")
+    _ICON_NAME_CACHE = (simplified_now, day, icon_filename)
     return icon_filename
 
 # ==== display/drawing functions ====
 
-def replace_color_rgb565(data, from_color, to_color):
-    out = bytearray(len(data))
-    for i in range(0, len(data), 2):
-        color = (data[i] << 8) | data[i+1]
-        if color == from_color:
-            color = to_color
-        out[i] = color >> 8
-        out[i+1] = color & 0xFF
-    return out
-
-def rgb565_to_rgb888(color):
-    r = ((color >> 11) & 0x1F) << 3
-    g = ((color >> 5) & 0x3F) << 2
-    b = (color & 0x1F) << 3
-    return r, g, b
-
-def rgb888_to_rgb565(r, g, b):
-    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-
-def display_raw_image_in_chunks(display, filepath, x, y, width, height, scale=1, smooth=False, chunk_rows=8, clear_color=0x0000, clear=True):
-    """
-    Streams a raw RGB565 image to the GC9A01 display in chunks using blit_buffer(),
-    with optional integer scaling and sharpening (sharpening applied after scaling).
-
-    Args:
-        display:     Initialized GC9A01 display object.
-        filepath:    Path to the .raw RGB565 image file.
-        x, y:        Top-left position on the screen to draw the image.
-        width:       Width of the image in pixels.
-        height:      Height of the image in pixels.
-        scale:       Integer scaling factor (default: 1 = no scale).
-        smooth:      Add optional smoothing after scaling
-        chunk_rows:  Number of source image rows per chunk (default: 8).
-        clear_color: Optional background color (default: black).
-        clear:       If True, clear the screen before drawing.
-    """
-    import gc
-
-    def smooth_chunk(data, width, height, threshold=10):
-        out = bytearray(len(data))
-
-        for row in range(height):
-            for col in range(width):
-                center_idx = (row * width + col) * 2
-                center = (data[center_idx] << 8) | data[center_idx + 1]
-                r_sum, g_sum, b_sum, count = 0, 0, 0, 0
-
-                for dy in (-1, 0, 1):
-                    ny = row + dy
-                    if ny < 0 or ny >= height:
-                        continue
-                    for dx in (-1, 0, 1):
-                        nx = col + dx
-                        if nx < 0 or nx >= width:
-                            continue
-                        neighbor_idx = (ny * width + nx) * 2
-                        neighbor = (data[neighbor_idx] << 8) | data[neighbor_idx + 1]
-
-                        # Use your existing helper for RGB conversion
-                        r1, g1, b1 = rgb565_to_rgb888(center)
-                        r2, g2, b2 = rgb565_to_rgb888(neighbor)
-                        dist = abs(r1 - r2) + abs(g1 - g2) + abs(b1 - b2)
-
-                        if dist <= threshold:
-                            r_sum += r2
-                            g_sum += g2
-                            b_sum += b2
-                            count += 1
-
-                if count > 0:
-                    avg_r = r_sum // count
-                    avg_g = g_sum // count
-                    avg_b = b_sum // count
-                    smoothed = rgb888_to_rgb565(avg_r, avg_g, avg_b)
-                else:
-                    smoothed = center
-
-                out[center_idx] = smoothed >> 8
-                out[center_idx + 1] = smoothed & 0xFF
-
-        return out
-
-    bytes_per_pixel = 2
-    row_bytes = width * bytes_per_pixel
-
-    if clear:
-        display.fill(clear_color)
-
-
-    try:
-        with open(filepath, "rb") as f:
-            for row_start in range(0, height, chunk_rows):
-                actual_rows = min(chunk_rows, height - row_start)
-                chunk_size = actual_rows * row_bytes
-                chunk_data = f.read(chunk_size)
-
-                if scale == 1:
-                    display.blit_buffer(chunk_data, x, y + row_start, width, actual_rows)
-                else:
-                    scaled_width = width * scale
-                    scaled_height = actual_rows * scale
-                    scaled_chunk = bytearray(scaled_width * scaled_height * 2)
-
-                    for row in range(actual_rows):
-                        for col in range(width):
-                            src_idx = (row * width + col) * 2
-                            pixel_hi = chunk_data[src_idx]
-                            pixel_lo = chunk_data[src_idx + 1]
-
-                            for dy in range(scale):
-                                dest_row = row * scale + dy
-                                for dx in range(scale):
-                                    dest_col = col * scale + dx
-                                    dest_idx = (dest_row * scaled_width + dest_col) * 2
-                                    scaled_chunk[dest_idx] = pixel_hi
-                                    scaled_chunk[dest_idx + 1] = pixel_lo
-
-                    if smooth:
-                        scaled_chunk = smooth_chunk(scaled_chunk, scaled_width, scaled_height)
-
-                    display.blit_buffer(scaled_chunk, x, y + row_start * scale, scaled_width, scaled_height)
-
-                gc.collect()
-                
-    except Exception as e:
-        print("Error displaying image:", e)
-
-def display_1bit_image_in_chunks(display, path, x0, y0, width, height, fg_color, bg_color):
-    row_bytes = width // 8  # bytes per row in 1-bit format
-    with open(path, "rb") as f:
-        for y in range(height):
-            row = f.read(row_bytes)
-            buf = bytearray(width * 2)  # one line of RGB565
-            for x in range(width):
-                byte_index = x // 8
-                bit_index = 7 - (x % 8)
-                bit = (row[byte_index] >> bit_index) & 1
-                color = fg_color if bit else bg_color
-                i = x * 2
-                buf[i] = color >> 8
-                buf[i + 1] = color & 0xFF
-            display.blit_buffer(buf, x0, y0 + y, width, 1)
-            
-def draw_sparse_grayscale(display, filepath):
-    with open(filepath, "rb") as f:
-        while True:
-            bytes_read = f.read(3)
-            if not bytes_read or len(bytes_read) < 3:
-                break
-            x, y, gray = bytes_read
-            # Convert grayscale to RGB565 (approximate)
-            rgb565 = ((gray & 0xF8) << 8) | ((gray & 0xFC) << 3) | (gray >> 3)
-            display.pixel(x, y, rgb565)
-
-def draw_sparse_1bit(display, filepath, color=0x0000):
-    with open(filepath, "rb") as f:
-        while True:
-            bytes_read = f.read(2)
-            if not bytes_read or len(bytes_read) < 2:
-                break
-            x, y = bytes_read
-            display.pixel(x, y, color)
-
 def draw_weather_icon(gc9a01, simplified_now, x, y, is_daytime=None):
 #    gc9a01.fill_rect(x, y, 48, 32, 0)
     if is_daytime is None:
@@ -1041,8 +978,11 @@ def draw_weather_icon(gc9a01, simplified_now, x, y, is_daytime=None):
     icon_filename = get_icon_filename(simplified_now, day)
     if icon_filename:
         try:
-            with open(icon_filename, "rb") as f:
-                icon_data = f.read()
+            icon_data = _ICON_CACHE.get(icon_filename)
+            if icon_data is None:
+                # Not preloaded (or preload ran out of RAM) - fall back to flash
+                with open(icon_filename, "rb") as f:
+                    icon_data = f.read()
             gc9a01.blit_buffer(icon_data, x, y, 64, 64)
 
         except OSError:
@@ -1058,7 +998,7 @@ def row_visible_width(y, diameter=240):
         return 0  # outside the circle
     return int(2 * math.sqrt(r**2 - dy**2))
 
-def center_smtext(text, y, fg=color565(255,255,255), bg=color565(0,0,0)):
+def center_smtext(text, y, fg=WHITE, bg=BLACK):
     visible_width = row_visible_width(y)
     text_width = len(text) * 8   # 8 pixel wide text
     if visible_width == 0:
@@ -1066,7 +1006,7 @@ def center_smtext(text, y, fg=color565(255,255,255), bg=color565(0,0,0)):
     x = (240 - visible_width) // 2 + (visible_width - text_width) // 2
     display.text(font_sm, text, x, y, fg, bg)
     
-def center_lgtext(text, y, fg=color565(255,255,255), bg=color565(0,0,0)):
+def center_lgtext(text, y, fg=WHITE, bg=BLACK):
     visible_width = row_visible_width(y)
     text_width = len(text) * 16   # 16 pixel wide text
     if visible_width == 0:
@@ -1074,7 +1014,7 @@ def center_lgtext(text, y, fg=color565(255,255,255), bg=color565(0,0,0)):
     x = (240 - visible_width) // 2 + (visible_width - text_width) // 2
     display.text(font_lg, text, x, y, fg, bg)
     
-def center_hugetext(text, y, fg=color565(255,255,255), bg=color565(0,0,0)):
+def center_hugetext(text, y, fg=WHITE, bg=BLACK):
     visible_width = row_visible_width(y)
     text_width = len(text) * 16   # 16 pixel wide text
     if visible_width == 0:
@@ -1082,37 +1022,76 @@ def center_hugetext(text, y, fg=color565(255,255,255), bg=color565(0,0,0)):
     x = (240 - visible_width) // 2 + (visible_width - text_width) // 2
     display.text(font_huge, text, x, y, fg, bg)
 
+# The "in N seconds" countdown line redraws every second. Rendering it
+# into a RAM framebuffer and pushing one 240x16 blit halves the SPI bytes
+# per tick vs fill_rect + text: one address window instead of two, and
+# the erase and the glyphs go out in the same transfer.
+_count_buf = bytearray(240 * 16 * 2)
+_count_fb = framebuf.FrameBuffer(_count_buf, 240, 16, framebuf.RGB565)
+# "in N seconds" is 12 cells of the 8x8 font centered on the strip; only
+# the digit in cell 3 changes between ticks, so the rest is rasterised
+# once and each tick re-renders just that one glyph
+_COUNT_X = micropython.const(72)   # (240 - 12 * 8) // 2
+_DIGIT_X = micropython.const(96)   # _COUNT_X + 3 * 8
+_count_static_ready = False
+
+def blit_countdown(count, y=140):
+    global _count_static_ready
+    if not _count_static_ready:
+        _count_fb.fill(0)
+        _count_fb.text("in   seconds", _COUNT_X, 4, 0xFFFF)
+        _count_static_ready = True
+    _count_fb.fill_rect(_DIGIT_X, 0, 8, 16, 0)
+    _count_fb.text(str(count), _DIGIT_X, 4, 0xFFFF)
+    display.blit_buffer(_count_buf, 0, y, 240, 16)
+
+def countdown_seconds(seconds=5, y=140):
+    # Shared by every "going to Setup Mode in N seconds" screen - one
+    # copy of the loop's bytecode instead of one per error branch.
+    # Ticks against a deadline in 50 ms slices instead of one blocking
+    # time.sleep(1), and collects once per second so the heap is compact
+    # before the setup-mode network bring-up that always follows
+    for count in range(seconds, 0, -1):
+        deadline = time.ticks_add(time.ticks_ms(), 1000)
+        blit_countdown(count, y)
+        gc.collect()
+        while time.ticks_diff(deadline, time.ticks_ms()) > 0:
+            time.sleep_ms(50)
+
 # === Determine latitude and longitude from zip code ===
 def get_lat_lon(zip_code, country_code="us"):
     url = f"http://api.zippopotam.us/{country_code}/{zip_code}"
     try:
         response = urequests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            place = data["places"][0]
-            lat = float(place["latitude"])
-            lon = float(place["longitude"])
-            return lat, lon, "Lat/Lon Lookup OK"
-        elif response.status_code == 404:
-            print(f"Invalid Zip Code: {zip_code}")
-            return None, None, "Invalid Zip Code"
-        else:
-            print(f"Unexpected API status code: {response.status_code}")
-            return None, None, "Lat/Lon Lookup Site Error"
+        try:
+            if response.status_code == 200:
+                data = response.json()
+                place = data["places"][0]
+                lat = float(place["latitude"])
+                lon = float(place["longitude"])
+                return lat, lon, "Lat/Lon Lookup OK"
+            elif response.status_code == 404:
+                print(f"Invalid Zip Code: {zip_code}")
+                return None, None, "Invalid Zip Code"
+            else:
+                print(f"Unexpected API status code: {response.status_code}")
+                return None, None, "Lat/Lon Lookup Site Error"
+        finally:
+            response.close()
     except Exception as e:
         print("WiFi or API error during Zip to lat/lon lookup:", repr(e))
     return None, None, "WiFi or Site Error"
 
 
 # === Get Sunrise and sunset times if needed ====
-def update_sun_times_if_needed(lat, lon, gmt_offset, dst):
+def update_sun_times_if_needed(lat, lon, gmt_offset_secs, dst):
     global sunrise, sunset, last_sun_fetch_day
     now = time.localtime()
     today = (now[0], now[1], now[2])  # year, month, day
 
     if last_sun_fetch_day != today:
         print("Fetching new sunrise/sunset times...")
-        sr, ss = fetch_sunrise_sunset(lat, lon, gmt_offset, dst)
+        sr, ss = fetch_sunrise_sunset(lat, lon, gmt_offset_secs)
         if sr and ss:
             sunrise = sr
             sunset = ss
@@ -1123,54 +1102,49 @@ def update_sun_times_if_needed(lat, lon, gmt_offset, dst):
             
 # === Helpers for extracting strings and data from json and streams ====
 
-def extract_first_json_string_value(raw_json, key):
-    """
-    Extracts the first string value for a given key in raw JSON text.
-    Returns the string value, or None if not found.
-    
-    This is lightweight and avoids parsing large JSON structures.
-    """
-    search_key = f'"{key}"'
-    idx = raw_json.find(search_key)
-    if idx == -1:
-        return None
-
-    # Find the colon separating key and value
-    colon_idx = raw_json.find(":", idx + len(search_key))
-    if colon_idx == -1:
-        return None
-
-    # Find the surrounding double quotes around the string value
-    start_quote = raw_json.find('"', colon_idx + 1)
-    if start_quote == -1:
-        return None
-    end_quote = raw_json.find('"', start_quote + 1)
-    if end_quote == -1:
-        return None
-
-    return raw_json[start_quote + 1:end_quote]
-
 def extract_first_json_string_value_stream(response_stream, key):
     """
-    Stream‐parse response_stream for the first JSON string field "key":"value"
+    Stream-parse response_stream for the first JSON string field "key":"value"
     without loading the full response into RAM.
+    Same incremental byte scanner as extract_first_number_stream: each byte
+    is visited once, the only state crossing chunk reads is key_pos and the
+    (short) value accumulator - no rolling buffer to re-search per chunk.
+    Returns the decoded value string, or None if the key is never seen.
     """
-    buf = b""
-    max_buf = 4096
-    # Compile regex pattern like: b'"shortForecast"\s*:\s*"([^"]+)"'
-    pattern = b'"' + key.encode("utf-8") + b'"\\s*:\\s*"([^"]+)"'
-    regex = ure.compile(pattern)
+    target = b'"' + key.encode("utf-8") + b'"'
+    key_pos = 0            # bytes of `target` matched so far (spans chunks)
+    capturing = False
+    in_value = False       # inside the value's double quotes
+    val_buf = bytearray()
 
     while True:
-        chunk = response_stream.read(256)
+        chunk = response_stream.read(1024)
         if not chunk:
             break
-        buf += chunk
-        if len(buf) > max_buf:
-            buf = buf[-max_buf:]
-        match = regex.search(buf)
-        if match:
-            return match.group(1).decode("utf-8")
+
+        for b in chunk:
+            if not capturing:
+                # advance the key match one byte at a time
+                if b == target[key_pos]:
+                    key_pos += 1
+                    if key_pos == len(target):
+                        key_pos = 0
+                        capturing = True
+                elif b == target[0]:
+                    key_pos = 1
+                else:
+                    key_pos = 0
+            elif not in_value:
+                if b == 34:              # opening quote of the value
+                    in_value = True
+                elif b == 58 or b == 32 or b == 9 or b == 10 or b == 13:
+                    pass                 # ':' and whitespace before the value
+                else:
+                    return None          # non-string value (number, null, {...)
+            else:
+                if b == 34:              # closing quote: done
+                    return val_buf.decode("utf-8")
+                val_buf.append(b)
     return None
 
 def fetch_first_station_id(obs_station_url, headers):
@@ -1180,77 +1154,210 @@ def fetch_first_station_id(obs_station_url, headers):
     """
     print("Fetching observation stations list…")
     r = urequests.get(obs_station_url, headers=headers)
-    stream = r.raw
+    try:
+        stream = r.raw
 
-    buf = b""
-    key = b'"id":'
-    max_buf = 4096  # keep up to 4 KB in memory
+        buf = bytearray()  # grown with extend / trimmed in place - no bytes copies
+        key = b'"id":'
+        max_buf = 4096  # keep up to 4 KB in memory
+        search_from = 0  # bytes before this offset have already been scanned
 
-    while True:
-        chunk = stream.read(256)
-        if not chunk:
-            break
-        buf += chunk
-        # Trim buffer
-        if len(buf) > max_buf:
-            buf = buf[-max_buf:]
-
-        # Look for `"id":` in buffer
-        idx = buf.find(key)
-        if idx != -1:
-            # Find the opening quote for the URL
-            start_quote = buf.find(b'"', idx + len(key))
-            if start_quote != -1:
+        while True:
+            chunk = stream.read(1024)
+            if not chunk:
+                break
+            buf.extend(chunk)
+            # Trim buffer in place
+            if len(buf) > max_buf:
+                trim = len(buf) - max_buf
+                del buf[:trim]
+                search_from = max(0, search_from - trim)
+
+            # Drain every complete `"id":` candidate already in the buffer,
+            # skipping the already-scanned prefix
+            while True:
+                idx = buf.find(key, search_from)
+                if idx == -1:
+                    # Next chunk can only complete a key starting in the tail
+                    search_from = max(0, len(buf) - len(key) + 1)
+                    break
+                search_from = idx  # candidate may still be incomplete - keep it in range
+                # Find the opening quote for the URL
+                start_quote = buf.find(b'"', idx + len(key))
+                if start_quote == -1:
+                    break  # wait for more data
                 end_quote = buf.find(b'"', start_quote + 1)
-                if end_quote != -1:
-                    url = buf[start_quote + 1:end_quote].decode("utf-8")
-                    # Only accept URLs that point to a station
-                    if "/stations/" in url:
-                        station_id = url.rsplit("/", 1)[-1]
-                        print("Extracted station_id:", station_id)
-                        r.close()
-                        gc.collect()
-                        return station_id
-                    # otherwise keep searching after this index
-                    buf = buf[end_quote+1:]
-    r.close()
-    gc.collect()
-    print("Failed to extract stationIdentifier from stream.")
-    return None
+                if end_quote == -1:
+                    break  # wait for more data
+                # Stay in bytes - only the winning station id gets decoded
+                url = bytes(buf[start_quote + 1:end_quote])
+                # Only accept URLs that point to a station
+                if b"/stations/" in url:
+                    station_id = url.rsplit(b"/", 1)[-1].decode("utf-8")
+                    print("Extracted station_id:", station_id)
+                    return station_id
+                # otherwise keep searching after this candidate
+                del buf[:end_quote+1]
+                search_from = 0
+        print("Failed to extract stationIdentifier from stream.")
+        return None
+    finally:
+        r.close()
 
-def extract_first_number_stream_generic(stream, pattern):
+def extract_first_number_stream(stream, key, nested=False):
     """
-    Stream-parse `stream` to find the first numeric value matching `pattern`.
+    Stream-parse `stream` to find the first numeric value following `key`.
     - stream: a file-like object supporting .read()
-    - pattern: a bytes regex with one capture group for the number, e.g.
-        rb'"temperature"\s*:\s*([0-9]+(?:\.[0-9]+)?)'
-        rb'"relativeHumidity"\s*:\s*\{[^}]*"value"\s*:\s*([0-9]+(?:\.[0-9]+)?)'
+    - key: the quoted field name as bytes, e.g. b'"temperature"'
+    - nested: True when the number sits in a sub-object, e.g.
+        "relativeHumidity": {..., "value": 12.3}
+      in which case we skip forward to the next '"value"' after the key.
+    Runs as an incremental byte scanner: each byte is visited once and only
+    a couple of integers of state survive across chunk reads - no rolling
+    buffer to re-search and no bytes concatenation. Cross-chunk continuity
+    needs at most len(key) bytes of partial-match state, carried in key_pos.
     Returns:
       float(parsed_number) on success,
       None if no match or parse error.
     """
-    buf = b""                         # rolling buffer of recent bytes
-    max_buf = 4096                    # cap buffer at 4 KB to limit RAM use
-    prog = ure.compile(pattern)       # compile the regex once
+    VALUE_KEY = b'"value"'
+    target = key
+    key_pos = 0            # bytes of `target` matched so far (spans chunks)
+    capturing = False
+    num_buf = bytearray()  # digit accumulator, tens of bytes at most
 
     while True:
-        chunk = stream.read(256)      # read small 256-byte chunks
+        chunk = stream.read(1024)
         if not chunk:
-            break                     # end of stream
+            # urequests sockets are blocking: read() returns b'' only at
+            # EOF (and None once the connection is torn down) - either way
+            # there is no more data coming
+            break
 
-        buf += chunk
-        if len(buf) > max_buf:
-            buf = buf[-max_buf:]      # drop oldest data beyond 4 KB
+        for b in chunk:
+            if not capturing:
+                # advance the key match one byte at a time
+                if b == target[key_pos]:
+                    key_pos += 1
+                    if key_pos == len(target):
+                        key_pos = 0
+                        if nested and target is not VALUE_KEY:
+                            target = VALUE_KEY   # now hunt the inner "value"
+                        else:
+                            capturing = True
+                elif b == target[0]:
+                    key_pos = 1
+                else:
+                    key_pos = 0
+            else:
+                if 48 <= b <= 57 or b == 45 or b == 46:  # 0-9 - .
+                    num_buf.append(b)
+                elif num_buf:
+                    # first non-numeric byte after the number: done
+                    try:
+                        return float(bytes(num_buf))
+                    except ValueError:
+                        return None
+                elif b == 58 or b == 32 or b == 9 or b == 10 or b == 13:
+                    pass                 # ':' and whitespace before the number
+                else:
+                    return None          # non-numeric value (e.g. null)
 
-        m = prog.search(buf)          # search buffer for the pattern
-        if m:
-            # m.group(1) is the first capture—our numeric string
+    if num_buf:
+        # stream ended right at the end of the number
+        try:
+            return float(bytes(num_buf))
+        except ValueError:
+            return None
+    return None                       # no match found
+
+def extract_fields_stream(stream, specs):
+    """
+    Stream-parse `stream` for several JSON fields in one pass.
+    - stream: a file-like object supporting .read()
+    - specs: list of (key, nested) tuples, key as bytes e.g. b'"forecast"',
+      nested=True when the value sits under a sub-object's "value" field.
+    Runs one small byte FSM per requested field over a single pass of the
+    stream, so N fields cost one HTTP round trip instead of N. String
+    values are decoded, numeric values come back as int (or float when
+    fractional).
+    Returns a dict keyed by the unquoted field name; None if not seen.
+    """
+    VALUE_KEY = b'"value"'
+    # per-field state: [name, target, key_pos, phase, nested, value_buf]
+    # phase: 0=matching key, 1=expecting value, 2=in string, 3=in number, 4=done
+    fsms = []
+    results = {}
+    for key, nested in specs:
+        name = key.decode().strip('"')
+        results[name] = None
+        fsms.append([name, key, 0, 0, nested, bytearray()])
+
+    remaining = len(fsms)
+
+    while remaining:
+        chunk = stream.read(1024)
+        if not chunk:
+            break  # b'' (or None on teardown) = EOF on the blocking socket
+        for b in chunk:
+            for f in fsms:
+                phase = f[3]
+                if phase == 4:
+                    continue
+                if phase == 0:
+                    target = f[1]
+                    if b == target[f[2]]:
+                        f[2] += 1
+                        if f[2] == len(target):
+                            f[2] = 0
+                            if f[4] and target is not VALUE_KEY:
+                                f[1] = VALUE_KEY   # now hunt the inner "value"
+                            else:
+                                f[3] = 1
+                    elif b == target[0]:
+                        f[2] = 1
+                    else:
+                        f[2] = 0
+                elif phase == 1:
+                    if b == 34:                              # opening quote
+                        f[3] = 2
+                    elif 48 <= b <= 57 or b == 45 or b == 46:  # 0-9 - .
+                        f[5].append(b)
+                        f[3] = 3
+                    elif b == 58 or b == 32 or b == 9 or b == 10 or b == 13:
+                        pass               # ':' and whitespace before the value
+                    else:
+                        f[3] = 4           # non-capturable value (null, {...})
+                        remaining -= 1
+                elif phase == 2:
+                    if b == 34:                              # closing quote
+                        results[f[0]] = bytes(f[5]).decode("utf-8")
+                        f[3] = 4
+                        remaining -= 1
+                    else:
+                        f[5].append(b)
+                else:  # phase == 3, capturing a number
+                    if 48 <= b <= 57 or b == 45 or b == 46:
+                        f[5].append(b)
+                    else:
+                        s = bytes(f[5])
+                        try:
+                            results[f[0]] = float(s) if b'.' in s else int(s)
+                        except ValueError:
+                            pass
+                        f[3] = 4
+                        remaining -= 1
+
+    # stream may end right at the end of a number
+    for f in fsms:
+        if f[3] == 3 and f[5]:
+            s = bytes(f[5])
             try:
-                return float(m.group(1))
-            except Exception:
-                return None
+                results[f[0]] = float(s) if b'.' in s else int(s)
+            except ValueError:
+                pass
 
-    return None                       # no match found
+    return results
 
 def titlecase(s):
     return ' '.join(word.capitalize() for word in s.split())
@@ -1264,43 +1371,49 @@ def get_nws_metadata(lat, lon):
         # Step 1: Get point data for the lat/lon
         print("Fetching point data:", f"https://api.weather.gov/points/{lat},{lon}")
         r = urequests.get(f"https://api.weather.gov/points/{lat},{lon}", headers=headers)
-        
-        if r.status_code == 404:
-            try:
-                err_data = r.json()
-                detail = err_data.get("detail", "").lower()
-                title = err_data.get("title", "").lower()
-                error_type = err_data.get("type", "").lower()
-
-                if (
-                    "outside the forecast area" in detail
-                    or "unable to provide data" in detail
-                    or "invalid point" in title
-                    or "invalidpoint" in error_type
-                ):
-                    return "Location outside US NWS area"
-                else:
-                    return f"NWS error: {detail}"
-            except Exception:
-                return "NWS 404 error"
-
-        if r.status_code != 200:
-            return f"NWS status {r.status_code}"
-        
-        raw = r.text
-        print("Downloaded length (point data):", len(raw))
-        r.close()
-
-        point_data = json.loads(raw)
-        properties = point_data.get("properties", {})
+        try:
+            if r.status_code == 404:
+                try:
+                    err_data = r.json()
+                    detail = err_data.get("detail", "").lower()
+                    title = err_data.get("title", "").lower()
+                    error_type = err_data.get("type", "").lower()
+
+                    if (
+                        "outside the forecast area" in detail
+                        or "unable to provide data" in detail
+                        or "invalid point" in title
+                        or "invalidpoint" in error_type
+                    ):
+                        return "Location outside US NWS area"
+                    else:
+                        return f"NWS error: {detail}"
+                except Exception:
+                    return "NWS 404 error"
+
+            if r.status_code != 200:
+                return f"NWS status {r.status_code}"
+
+            # Stream just the fields we need - avoids materializing the whole
+            # response as a str and then again as a parsed dict
+            vals = extract_fields_stream(r.raw, [
+                (b'"forecast"', False),
+                (b'"observationStations"', False),
+                (b'"forecastHourly"', False),
+                (b'"gridId"', False),
+                (b'"gridX"', False),
+                (b'"gridY"', False),
+            ])
+        finally:
+            r.close()
 
-        forecast_url = properties.get("forecast")
-        obs_station_url = properties.get("observationStations")
-        forecast_hourly_url = properties.get("forecastHourly")
+        forecast_url = vals["forecast"]
+        obs_station_url = vals["observationStations"]
+        forecast_hourly_url = vals["forecastHourly"]
 
-        office = properties.get("gridId")
-        grid_x = properties.get("gridX")
-        grid_y = properties.get("gridY")
+        office = vals["gridId"]
+        grid_x = vals["gridX"]
+        grid_y = vals["gridY"]
 
         # Construct fallback hourly forecast URL if missing
         if not forecast_hourly_url and office and grid_x is not None and grid_y is not None:
@@ -1315,10 +1428,6 @@ def get_nws_metadata(lat, lon):
         print("Fetching observation stations list:", obs_station_url)
         station_id = fetch_first_station_id(obs_station_url, headers)
 
-        # Clean up to free memory
-        del raw, point_data, properties
-        gc.collect()
-
         if not station_id:
             print("No observation station found.")
             return None
@@ -1326,7 +1435,9 @@ def get_nws_metadata(lat, lon):
         return {
             "forecast_url": forecast_url,
             "hourly_url": forecast_hourly_url,
-            "station_id": station_id
+            "station_id": station_id,
+            # Prebuilt here so refresh-path consumers never re-format it
+            "obs_url": f"https://api.weather.gov/stations/{station_id}/observations/latest"
         }
 
     except Exception as e:
@@ -1384,6 +1495,13 @@ def find_period_bounds(raw, pos):
     # fallback if no match found
     return start, len(raw) - 1
 
+# Precompiled once at import - ure.compile allocates heap, so don't pay for
+# it on every forecast refresh
+_PAT_PERIOD_NAME = ure.compile(rb'"name"\s*:\s*"([^"]*)"')
+_PAT_PERIOD_SHORTFORECAST = ure.compile(rb'"shortForecast"\s*:\s*"([^"]*)"')
+_PAT_PERIOD_TEMPERATURE = ure.compile(rb'"temperature"\s*:\s*(\d+)')
+_PAT_PERIOD_ISDAYTIME = ure.compile(rb'"isDaytime"\s*:\s*(true|false)')
+
 def extract_forecast_periods_stream(response_stream, max_night_periods=3, max_day_periods=7, max_buf=4096):
     buf = b""
     periods = []
@@ -1406,12 +1524,6 @@ def extract_forecast_periods_stream(response_stream, max_night_periods=3, max_da
                     return i
         return -1
 
-    # Precompile regexes for fields
-    pattern_name = ure.compile(rb'"name"\s*:\s*"([^"]*)"')
-    pattern_shortForecast = ure.compile(rb'"shortForecast"\s*:\s*"([^"]*)"')
-    pattern_temperature = ure.compile(rb'"temperature"\s*:\s*(\d+)')
-    pattern_isDaytime = ure.compile(rb'"isDaytime"\s*:\s*(true|false)')
-
     def extract_str(pattern, text):
         m = pattern.search(text)
         return m.group(1).decode("utf-8") if m else ""
@@ -1428,7 +1540,7 @@ def extract_forecast_periods_stream(response_stream, max_night_periods=3, max_da
         return m.group(1) == b"true" if m else False
 
     while True:
-        chunk = response_stream.read(256)
+        chunk = response_stream.read(1024)
         if not chunk:
             break
         buf += chunk
@@ -1466,10 +1578,10 @@ def extract_forecast_periods_stream(response_stream, max_night_periods=3, max_da
             period_text = buf[start_obj:end_obj+1]
 
             # Extract fields
-            name = extract_str(pattern_name, period_text)
-            shortForecast = extract_str(pattern_shortForecast, period_text)
-            temperature = extract_int(pattern_temperature, period_text)
-            isDaytime = extract_bool(pattern_isDaytime, period_text)
+            name = extract_str(_PAT_PERIOD_NAME, period_text)
+            shortForecast = extract_str(_PAT_PERIOD_SHORTFORECAST, period_text)
+            temperature = extract_int(_PAT_PERIOD_TEMPERATURE, period_text)
+            isDaytime = extract_bool(_PAT_PERIOD_ISDAYTIME, period_text)
 
             should_append = False
             if isDaytime and day_count < max_day_periods:
@@ -1651,29 +1763,29 @@ def get_weather_data(lat, lon, metadata, headers):
 
         # Do forecast fetch for multi=day forecast
         print("Fetching URL:", forecast_url)
-        print("Before fetching forecast JSON:")
-        print_memory_usage()
-        test_free_memory()
+        if DEBUG:
+            print("Before fetching forecast JSON:")
+            print_memory_usage()
+            test_free_memory()
         
         period = []
         try:
             r = urequests.get(forecast_url, headers=headers)
-            gc.collect()
-            
-            periods = extract_forecast_periods_stream(r.raw)
-            gc.collect()
-            r.close()
+            try:
+                periods = extract_forecast_periods_stream(r.raw)
+            finally:
+                r.close()  # don't leak the TLS socket on a parse error
             del r
-            gc.collect()
             
-            # DEBUG: print what was parsed
-            print("Parsed forecast periods:")
-            for i, f in enumerate(periods):
-                print(f"Period {i}: name={f['name']!r}, shortForecast={f['shortForecast']!r}")
+            if DEBUG:
+                # print what was parsed
+                print("Parsed forecast periods:")
+                for i, f in enumerate(periods):
+                    print(f"Period {i}: name={f['name']!r}, shortForecast={f['shortForecast']!r}")
 
-            print("After fetching forecast JSON (raw text in memory):")
-            print_memory_usage()
-            test_free_memory()
+                print("After fetching forecast JSON (raw text in memory):")
+                print_memory_usage()
+                test_free_memory()
 
             # Extract multiple forecast periods
             # Post-process each period to simplify forecast and trim name
@@ -1697,20 +1809,18 @@ def get_weather_data(lat, lon, metadata, headers):
                 }]
             
             print(f"Extracted {len(periods)} forecast periods")
-            for i, period in enumerate(periods):
-                print(f"Period {i}: name='{period.get('name', '')}'")
-                print(f"Period {i}: shortForecast='{period.get('shortForecast', '')}'")
-                print(f"Period {i}: simpleForecast='{period.get('simpleForecast', '')}'")
-                print(f"Period {i}: forecast1='{period['forecast1']}'")
-                print(f"Period {i}: forecast1_short='{period['forecast1_short']}'")
-                if period['forecast2']:
-                    print(f"          forecast2='{period['forecast2']}'")
-                    print(f"          forecast2_short='{period['forecast2_short']}'")
-            print("After extracting forecast periods")
-            print_memory_usage()
-
-            print("After freeing raw forecast JSON and running GC:")
-            print_memory_usage()
+            if DEBUG:
+                for i, period in enumerate(periods):
+                    print(f"Period {i}: name='{period.get('name', '')}'")
+                    print(f"Period {i}: shortForecast='{period.get('shortForecast', '')}'")
+                    print(f"Period {i}: simpleForecast='{period.get('simpleForecast', '')}'")
+                    print(f"Period {i}: forecast1='{period['forecast1']}'")
+                    print(f"Period {i}: forecast1_short='{period['forecast1_short']}'")
+                    if period['forecast2']:
+                        print(f"          forecast2='{period['forecast2']}'")
+                        print(f"          forecast2_short='{period['forecast2_short']}'")
+                print("After extracting forecast periods")
+                print_memory_usage()
             
         except Exception as e:
             print("Error fetching or parsing forecast data:", e)
@@ -1724,6 +1834,9 @@ def get_weather_data(lat, lon, metadata, headers):
                 "isDaytime": None,
             }]
                   
+        # One heap walk per refresh instead of one after every HTTP step
+        gc.collect()
+
         # Return the final values
         return periods
 
@@ -1776,154 +1889,126 @@ def shorten_period_name(name):
 
     return name
 
+# Single-pass matchers for simplify_forecast, built once at module load.
+# Alternatives are ordered so longer phrases win over their prefixes at the
+# same position (e.g. "slight chance" before "chance", "windy" before "wind").
+_MODIFIER_RE = ure.compile(
+    r"slight chance|light|chance|mostly|partly|partial|shallow|patches|patchy|"
+    r"likely|heavy|scattered|isolated|drifting|blowing|few|broken|widespread|"
+    r"frequent|gusty|gust|intermittent|increasing|occasional|variable"
+)
+_CONDITION_RE = ure.compile(
+    r"tornado|funnel cloud|hailstorms|hailstorm|blizzard|winter storm|"
+    r"winter weather|freezing rain|freezing drizzle|hail|sleet|"
+    r"ice crystals|ice pellets|ice|frost|flash flood|flood|dust storm|smoke|"
+    r"volcanic ash|dust|spray|sandstorm|sand|hurricane|tropical storm|"
+    r"thunderstorms|thunderstorm|t-storms|tstorms|lightning|storm|squall|"
+    r"showers|rain|precipitation|fog|snow grains|snow pellets|snow|clear|"
+    r"sunny|cloudy|overcast|windy|gusty|wind|drizzle|haze|mist"
+)
+
+# Abbreviations applied when a modifier shares the 14-character line:
+# modifiers squeeze to <= 6 chars, conditions to <= 7 chars.
+_MODIFIER_ABBREV = {
+    "isolated": "Isol", "slight chance": "Chance", "scattered": "Scattr",
+    "partial": "Prtial", "shallow": "Shllow", "patches": "Patchy",
+    "drifting": "Drftng", "blowing": "Blowng", "widespread": "Wdsprd",
+    "frequent": "Frqunt", "intermittent": "Intmit", "increasing": "Increa",
+    "occasional": "Occasl", "variable": "Variab",
+}
+_CONDITION_ABBREV = {
+    "hailstorm": "Hailstrm", "hailstorms": "Hailstrm", "blizzard": "Blizzrd",
+    "winter storm": "Win Stm", "winter weather": "Win Weth",
+    "freezing rain": "Fr Rain", "freezing drizzle": "Fr Drzl",
+    "flash flood": "Fl Flood", "dust storm": "Dust St",
+    "volcanic ash": "Volc Ash", "hurricane": "Hurrcan",
+    "tropical storm": "Trop St", "thunderstorm": "Tstorms",
+    "thunderstorms": "Tstorms", "t-storms": "Tstorms", "tstorms": "Tstorms",
+    "precipitation": "Precip", "funnel cloud": "FunlCld",
+    "sandstorm": "SndStrm", "snow grains": "Snw Grs",
+    "ice crystals": "Ice Xtl", "ice pellets": "Ice Plt",
+    "snow pellets": "Snw Plt", "overcast": "Ovrcast", "lightning": "Lightng",
+}
+# Conditions too long for the 14-char line even with no modifier present
+_CONDITION_ABBREV_NO_MOD = {
+    "freezing drizzle": "Frzing Drizzle",
+}
+
+# The shortForecast strings NWS actually sends are heavily skewed toward a
+# handful of phrases; map those straight to their precomputed output so the
+# common case is a single dict lookup with no regex scan at all.
+_FAST_MAP = {
+    "Sunny": "Sunny",
+    "Clear": "Clear",
+    "Mostly Sunny": "Mostly Sunny",
+    "Mostly Clear": "Mostly Clear",
+    "Partly Sunny": "Partly Sunny",
+    "Partly Cloudy": "Partly Cloudy",
+    "Mostly Cloudy": "Mostly Cloudy",
+    "Cloudy": "Cloudy",
+    "Fog": "Fog",
+    "Patchy Fog": "Patchy Fog",
+    "Rain": "Rain",
+    "Rain Showers": "Rain",
+    "Chance Rain Showers": "Chance Rain",
+    "Slight Chance Rain Showers": "Chance Rain",
+    "Showers And Thunderstorms": "Showers",
+    "Chance Showers And Thunderstorms": "Chance Showers",
+    "Snow": "Snow",
+    "Chance Snow Showers": "Chance Snow",
+    "Light Rain": "Light Rain",
+    "Thunderstorms": "Thunderstorms",
+}
+
+# Last (raw forecast, simplified) pair - NWS shortForecast strings are
+# sticky for hours, so most refreshes hit this single-entry cache.
+_SIMPLIFY_CACHE = (None, None)
+
 def simplify_forecast(forecast):
-    MODIFIERS = ["Slight Chance", "Light", "Chance", "Mostly", "Partly", "Partial",
-                 "Shallow", "Patches", "Patchy", "Likely", "Heavy", "Scattered",
-                 "Isolated", "Drifting", "Blowing", "Few", "Broken", "Widespread",
-                 "Frequent", "Gust", "Gusty", "Intermittent", "Increasing", "Occasional",
-                 "Variable"
-    ]
-    CONDITIONS = [
-        "Tornado", "Funnel Cloud", "Hailstorm", "Hailstorms", "Blizzard", "Winter Storm", "Winter Weather"
-        "Freezing Rain", "Freezing Drizzle", "Hail", "Sleet", "Ice", "Frost",
-        "Flash Flood", "Flood", "Dust Storm", "Smoke", "Volcanic Ash", "Dust", "Spray", "Sand",
-        "Hurricane", "Tropical storm", "Thunderstorms", "Sandstorm",
-        "Thunderstorm", "T-storms", "Tstorms", "Lightning"
-        "Storm", "Squall", "Showers", "Rain", "Precipitation"
-        "Fog", "Snow", "Clear", "Sunny",
-        "Cloudy", "Overcast", "Windy", "Gusty", "Wind", "Drizzle",
-        "Haze", "Mist", "Snow Grains", "Ice Crystals", "Ice Pellets", "Snow Pellets"
-    ]
+    global _SIMPLIFY_CACHE
+
     # First, make sure there is a valid forecast
     if not forecast or not isinstance(forecast, str):
         return "No Forecast"
-    
-    # Define priority by order in CONDITIONS list (lower index = higher priority)
-    # Find highest priority condition (lowest index in CONDITIONS)
-
-    # Cut off forecast at any strong separator (only use "current" condition)
-    for sep in [" then ", ";", ","]:
-        if sep in forecast.lower():
-            forecast = forecast.lower().split(sep, 1)[0]
-            break
 
-    forecast = forecast.strip().lower()
+    hit = _FAST_MAP.get(forecast)
+    if hit is not None:
+        return hit
 
-    found_modifiers = []
-    found_conditions = []
+    if forecast == _SIMPLIFY_CACHE[0]:
+        return _SIMPLIFY_CACHE[1]
+    raw = forecast  # keep the original string as the cache key
 
-    # Find all modifiers present with positions
-    for mod in MODIFIERS:
-        pos = forecast.find(mod.lower())
-        if pos != -1:
-            found_modifiers.append((pos, mod))
+    # Lowercase exactly once - the match tables are already lowercase
+    f = forecast.lower()
 
-    # Find all conditions present with positions
-    for cond in CONDITIONS:
-        pos = forecast.find(cond.lower())
-        if pos != -1:
-            found_conditions.append((pos, cond))
+    # Cut off forecast at the earliest strong separator (only use the
+    # "current" condition) - find() instead of `in` + split avoids the
+    # extra scan and throwaway list per separator
+    cuts = [i for i in (f.find(" then "), f.find(";"), f.find(",")) if i != -1]
+    if cuts:
+        f = f[:min(cuts)]
 
-    # Pick earliest modifier if any
-    found_modifiers.sort(key=lambda x: x[0])
-    found_modifier = found_modifiers[0][1] if found_modifiers else ""
+    forecast = f.strip()
 
-    # Pick highest priority condition present:
-    # conditions with lowest index in CONDITIONS list are highest priority
-    priority_found_conditions = [(CONDITIONS.index(cond), pos, cond)
-                                 for pos, cond in found_conditions if cond in CONDITIONS]
-    priority_found_conditions.sort()  # sorts by priority index, then position, then cond
-    found_condition = priority_found_conditions[0][2] if priority_found_conditions else ""
+    # One scan each instead of ~40 str.find calls: search() returns the
+    # leftmost match of the precompiled alternation
+    m = _MODIFIER_RE.search(forecast)
+    mod_term = m.group(0) if m else ""
+    m = _CONDITION_RE.search(forecast)
+    cond_term = m.group(0) if m else ""
 
     # Special rules for modifiers + conditions to keep total under 14 characters
-    # First, if no modifier, just check for the over 14 character conditions and shorten
-    if not found_modifier:
-        if found_condition.lower() =="freezing drizzle":
-            found_condition = "Frzing Drizzle"
- 
-    # If get here, there is modifier, to check modifiers and conditions
-    else:    
-        #First check modifiers and make 6 chars or less
-        if found_modifier.lower() == "isolated":
-            found_modifier = "Isol"
-        if found_modifier.lower() == "slight chance":
-            found_modifier = "Chance"
-        if found_modifier.lower() == "scattered":
-            found_modifier = "Scattr"
-        if found_modifier.lower() == "partial":
-            found_modifier = "Prtial"
-        if found_modifier.lower() == "shallow":
-            found_modifier = "Shllow"
-        if found_modifier.lower() == "patches":
-            found_modifier = "Patchy"
-        if found_modifier.lower() == "drifting":
-            found_modifier = "Drftng"
-        if found_modifier.lower() == "blowing":
-            found_modifier = "Blowng"
-        if found_modifier.lower() == "widespread":
-            found_modifier = "Wdsprd"
-        if found_modifier.lower() == "frequent":
-            found_modifier = "Frqunt"
-        if found_modifier.lower() == "intermittent":
-            found_modifier = "Intmit"
-        if found_modifier.lower() == "increasing":
-            found_modifier = "Increa"
-        if found_modifier.lower() == "occasional":
-            found_modifier = "Occasl"
-        if found_modifier.lower() == "variable":
-            found_modifier = "Variab"
-        # Next check conditions and make 7 chars or less
-        if found_condition.lower() =="hailstorm":
-            found_condition = "Hailstrm"
-        if found_condition.lower() =="hailstorms":
-            found_condition = "Hailstrm"
-        if found_condition.lower() =="blizzard":
-            found_condition = "Blizzrd"
-        if found_condition.lower() =="winter storm":
-            found_condition = "Win Stm"
-        if found_condition.lower() =="winter weather":
-            found_condition = "Win Weth"
-        if found_condition.lower() =="freezing rain":
-            found_condition = "Fr Rain"
-        if found_condition.lower() =="freezing drizzle":
-            found_condition = "Fr Drzl"
-        if found_condition.lower() =="flash flood":
-            found_condition = "Fl Flood"
-        if found_condition.lower() =="dust storm":
-            found_condition = "Dust St"
-        if found_condition.lower() =="volcanic ash":
-            found_condition = "Volc Ash"
-        if found_condition.lower() =="hurricane":
-            found_condition = "Hurrcan"
-        if found_condition.lower() =="tropical storm":
-            found_condition = "Trop St"
-        if found_condition.lower() =="thunderstorm":
-            found_condition = "Tstorms"
-        if found_condition.lower() =="thunderstorms":
-            found_condition = "Tstorms"
-        if found_condition.lower() =="thunderstorms":
-            found_condition = "Tstorms"
-        if found_condition.lower() =="t-storms":
-            found_condition = "Tstorms"
-        if found_condition.lower() =="precipitation":
-            found_condition = "Precip"
-        if found_condition.lower() =="funnel cloud":
-            found_condition = "FunlCld"
-        if found_condition.lower() =="sandstorm":
-            found_condition = "SndStrm"
-        if found_condition.lower() =="snow grains":
-            found_condition = "Snw Grs"
-        if found_condition.lower() =="ice crystals":
-            found_condition = "Ice Xtl"
-        if found_condition.lower() =="ice pellets":
-            found_condition = "Ice Plt"
-        if found_condition.lower() =="snow pellets":
-            found_condition = "Snw Plt"
-        if found_condition.lower() =="overcast":
-            found_condition = "Ovrcast"
-        if found_condition.lower() =="lightning":
-            found_condition = "Lightng"
-            
+    # First, if no modifier, only the extra-long conditions need shortening
+    if not mod_term:
+        found_modifier = ""
+        found_condition = _CONDITION_ABBREV_NO_MOD.get(cond_term) or titlecase(cond_term)
+
+    # If get here, there is a modifier: abbreviate both via one dict lookup
+    else:
+        found_modifier = _MODIFIER_ABBREV.get(mod_term) or titlecase(mod_term)
+        found_condition = _CONDITION_ABBREV.get(cond_term) or titlecase(cond_term)
+
     phrase = f"{found_modifier} {found_condition}".strip()
 
     if not found_condition and not found_modifier:
@@ -1931,18 +2016,33 @@ def simplify_forecast(forecast):
         print("No Condition or Modifier found - Phrase:", phrase, "| type:", type(phrase))
         print("Using truncated Forecast - Forecast:", forecast, "| type:", type(forecast))
         s = forecast[:14]
-        return s[0].upper() + s[1:] if s else s
-    
+        result = s[0].upper() + s[1:] if s else s
+        _SIMPLIFY_CACHE = (raw, result)
+        return result
+
     # Return capitalized short forecast, <modifier> <condition>, truncated to 14 chars
     print("phrase:", phrase, "| type:", type(phrase))
-    return phrase[:14]
+    result = phrase[:14]
+    _SIMPLIFY_CACHE = (raw, result)
+    return result
 
     
+# Every rotating screen (weather, forecast, sun times) draws inside rows
+# 60..206 - the deepest content is the temp row at y=175 plus 32px of
+# glyphs. Clearing just that band instead of the full lower 180 rows
+# saves ~15 KB of SPI traffic per repaint; the rows below it are never
+# painted, so they are black already.
+_CONTENT_Y = micropython.const(60)
+_CONTENT_H = micropython.const(147)
+
+def clear_content_band():
+    display.fill_rect(0, _CONTENT_Y, 240, _CONTENT_H, BLACK)
+
 def display_weather(interval, temp, humidity, description, is_daytime=None):
     # Clear only the areas we'll update (not the whole screen)
-#     display.fill_rect(0, 0, 240, 60, color565(0, 0, 0))     # header
-    display.fill_rect(0, 60, 240, 180, color565(0, 0, 0))   # lower part
-    
+#     display.fill_rect(0, 0, 240, 60, BLACK)     # header
+    clear_content_band()
+
 
     center_lgtext(f"{interval}", 125, color565(220, 170, 240))
     line = description
@@ -1950,7 +2050,7 @@ def display_weather(interval, temp, humidity, description, is_daytime=None):
     draw_weather_icon(display, line, icon_x, 60, is_daytime)
     
     # Display 14 character weather conditions
-    center_hugetext(line, 140, color565(255, 255, 0))
+    center_hugetext(line, 140, YELLOW)
 
     if humidity is not None:
         display.text(font_huge, f"{temp}F", 50, 175, color565(255, 100, 100))
@@ -1966,8 +2066,8 @@ def display_weather(interval, temp, humidity, description, is_daytime=None):
         
 def display_then():
     # Blank just the icon area and condition text
-#    display.fill_rect(0, 60, 240, 64, color565(0, 0, 0))    # icon area
-    display.fill_rect(0, 140, 240, 32, color565(0, 0, 0))   # forecast text area
+#    display.fill_rect(0, 60, 240, 64, BLACK)    # icon area
+    display.fill_rect(0, 140, 240, 32, BLACK)   # forecast text area
 
 #    center_hugetext("Then", 140, color565(150, 200, 255))   # soft blue/cyan
     center_lgtext("Then", 148, color565(150, 200, 255))   # soft blue/cyan
@@ -1975,14 +2075,14 @@ def display_then():
 def display_forecast2(interval, temp, humidity, description, is_daytime=None):
     # Same layout as display_weather, but no need to clear entire lower section
     # Only clear icon and description area
-    display.fill_rect(0, 60, 240, 64, color565(0, 0, 0))    # icon area
-    display.fill_rect(0, 140, 240, 32, color565(0, 0, 0))   # forecast text area
+    display.fill_rect(0, 60, 240, 64, BLACK)    # icon area
+    display.fill_rect(0, 140, 240, 32, BLACK)   # forecast text area
 
     icon_x = (240 - 63) // 2  # Centered icon
     draw_weather_icon(display, description, icon_x, 60, is_daytime)
 
     # Forecast 2 text
-    center_hugetext(description, 140, color565(255, 255, 0))  # same as forecast1
+    center_hugetext(description, 140, YELLOW)  # same as forecast1
         
 def format_sun_time(t):
     # t is a time.struct_time or tuple like (year, month, day, hour, minute, second, ...)
@@ -2004,14 +2104,14 @@ def format_sun_time(t):
     return f"{hour_12}:{minute:02d} {am_pm}"
 
 def display_sun_times(sunrise, sunset):
-    display.fill_rect(0, 60, 240, 180, color565(0, 0, 0))  # Clear lower part
-    
+    clear_content_band()
+
     if sunrise and sunset:
         sunrise_str = format_sun_time(sunrise)
         sunset_str = format_sun_time(sunset)
         
-        center_lgtext("Sunrise:", 80, color565(255, 255, 0))
-        center_hugetext(sunrise_str, 100, color565(255, 255, 0))
+        center_lgtext("Sunrise:", 80, YELLOW)
+        center_hugetext(sunrise_str, 100, YELLOW)
         center_lgtext("Sunset:", 140, color565(255, 160, 0))
         center_hugetext(sunset_str, 160, color565(255, 160, 0))
         
@@ -2021,8 +2121,7 @@ def application_mode(settings):
     print("Free memory entering application mode")
     test_free_memory()
     
-    global start_update_requested
-    global gmt_offset
+    global gmt_offset_secs
     global sunrise, sunset, last_sun_fetch_day, last_displayed_time, last_displayed_date, last_sun_update_date
     global retry_allowed
 
@@ -2039,6 +2138,8 @@ def application_mode(settings):
     forecasts = []
     last_displayed_time = ""
     last_displayed_date = ""
+    last_day_key = 0       # month*100 + day of the last formatted date
+    current_date_str = ""
     
     # Forecast update parameters
     forecast_phase = 0
@@ -2062,12 +2163,16 @@ def application_mode(settings):
         lat_lon_complete = lat is not None and lon is not None
         if lat_lon_complete:
             print(f"Zip to lat/lon lookup OK: {lat}, {lon}")
-            settings["lat"] = lat
-            settings["lon"] = lon
-            save_settings(settings)
-            # Update local variables with new values
-            lat = settings["lat"]
-            lon = settings["lon"]
+            # Only rewrite settings.json (a flash erase cycle) when the
+            # coordinates actually changed; record the zip they were
+            # looked up for so the boot gate doesn't re-geocode
+            zip_used = settings.get("zip", "")
+            if ((settings.get("lat"), settings.get("lon")) != (lat, lon)
+                    or settings.get("lat_for_zip") != zip_used):
+                settings["lat"] = lat
+                settings["lon"] = lon
+                settings["lat_for_zip"] = zip_used
+                save_settings(settings)
         else:
             print(f"Failed to recover lat/lon. Reason: {reason}")
             if reason == "invalid_zip":
@@ -2077,10 +2182,7 @@ def application_mode(settings):
                 center_lgtext("Location Error", 80)
                 center_smtext(reason, 100)
                 center_smtext("Going to Setup Mode", 120)
-                for count in range(5,0, -1):
-                    display.fill_rect(0, 140, 240, 16, color565(0, 0, 0))
-                    center_smtext(f"in {count} seconds", 160)
-                    time.sleep(1)
+                countdown_seconds(5, 160)
                             
                 setup_mode()
                 server.run()
@@ -2102,10 +2204,7 @@ def application_mode(settings):
                 center_lgtext("Location Error", 80)
                 center_smtext(metadata, 100)
                 center_smtext("Going to Setup Mode", 140)
-                for count in range(5, 0, -1):
-                    display.fill_rect(0, 160, 240, 16, color565(0, 0, 0))
-                    center_smtext(f"in {count} seconds", 160)
-                    time.sleep(1)
+                countdown_seconds(5, 160)
 
                 setup_mode()
                 server.run()
@@ -2129,8 +2228,8 @@ def application_mode(settings):
         if new_forecasts:
             forecasts = new_forecasts
             
-            # Fetch initial sunrise/sunset (we already have gmt_offset and dst from settings)
-            sunrise, sunset = fetch_sunrise_sunset(lat, lon, gmt_offset)
+            # Fetch initial sunrise/sunset (we already have gmt_offset_secs and dst from settings)
+            sunrise, sunset = fetch_sunrise_sunset(lat, lon, gmt_offset_secs)
 
             cycle_length = len(forecasts) + 1
             
@@ -2141,13 +2240,13 @@ def application_mode(settings):
         else:
             forecasts = []
             cycle_length = 1
-            display.fill(color565(0, 0, 0))
+            display.fill(BLACK)
             center_lgtext("Weather data", 80)
             center_lgtext("unavailable", 100)
     else:
         forecasts = []
         cycle_length = 1
-        display.fill(color565(0, 0, 0))
+        display.fill(BLACK)
         center_lgtext("Location data", 80)
         center_lgtext("unavailable", 100)
         
@@ -2155,8 +2254,8 @@ def application_mode(settings):
     last_forecast_switch = time.time()  # ensures your display cycle works on the correct timing
 
     while True:
-        if start_update_requested:
-            start_update_requested = False
+        if _SW_STATE[2]:
+            _SW_STATE[2] = 0
             print("going to start update mode")
             start_update_mode()
             return   # exit application mode, switching to update mode
@@ -2178,12 +2277,15 @@ def application_mode(settings):
                 lat_lon_complete = lat is not None and lon is not None
                 if lat_lon_complete:
                     print(f"Recovered lat/lon: {lat}, {lon}")
-                    settings["lat"] = lat
-                    settings["lon"] = lon
-                    save_settings(settings)
-                    # Update local variables with new values
-                    lat = settings["lat"]
-                    lon = settings["lon"]
+                    # Skip the flash write when nothing changed, but
+                    # record lat_for_zip so the boot gate stays quiet
+                    zip_used = settings.get("zip", "")
+                    if ((settings.get("lat"), settings.get("lon")) != (lat, lon)
+                            or settings.get("lat_for_zip") != zip_used):
+                        settings["lat"] = lat
+                        settings["lon"] = lon
+                        settings["lat_for_zip"] = zip_used
+                        save_settings(settings)
                 else:
                     print(f"Failed to recover lat/lon. Reason: {reason}")
                     if reason == "invalid_zip":
@@ -2193,10 +2295,7 @@ def application_mode(settings):
                         center_lgtext("Location Error", 80)
                         center_smtext(reason, 100)
                         center_smtext("Going to Setup Mode", 120)
-                        for count in range(5,0, -1):
-                            display.fill_rect(0, 140, 240, 16, color565(0, 0, 0))
-                            center_smtext(f"in {count} seconds", 160)
-                            time.sleep(1)
+                        countdown_seconds(5, 160)
                             
                         setup_mode()
                         server.run()
@@ -2212,11 +2311,12 @@ def application_mode(settings):
                 else:
                     forecasts = []
                     cycle_length = 1
-                    display.fill_rect(0, 60, 240, 180, color565(0, 0, 0)) # x, y, w, h
+                    display.fill_rect(0, 60, 240, 180, BLACK) # x, y, w, h
                     center_lgtext("Weather Data", 80)
                     center_lgtext("Unavailable", 100)
-            
+
             last_weather_update = current_time
+            gc.collect()  # single collection per refresh cycle
         
         # Start new forecast display cycle every 10s
         if forecast_phase == 0 and time.time() - last_forecast_switch >= 10:
@@ -2276,7 +2376,12 @@ def application_mode(settings):
         # Get localtime *once* per loop
         now = localtime_with_offset()
         current_time_str = format_12h_time(now)
-        current_date_str = "{} {}".format(MONTHS[now[1]-1], now[2])
+
+        # Date changes once a day - only reformat when the ordinal moves
+        day_key = now[1] * 100 + now[2]
+        if day_key != last_day_key:
+            current_date_str = "{} {}".format(MONTHS[now[1]-1], now[2])
+            last_day_key = day_key
         
         # Update time display every second
         if current_time_str != last_displayed_time:
@@ -2297,12 +2402,17 @@ def application_mode(settings):
             if hour == 0 and 1 <= minute <= 10:
                 # Time to fetch sunrise/sunset for the new day
                 print("Fetching new sunrise/sunset data for date:", current_date_str)
-                sunrise, sunset = fetch_sunrise_sunset(lat, lon, gmt_offset)
+                sunrise, sunset = fetch_sunrise_sunset(lat, lon, gmt_offset_secs)
                 last_sun_update_date = current_date_str
 
-        time.sleep(0.1)  # Short sleep to maintain responsiveness
-
-#        time.sleep(1)
+        # Sleep until the next second boundary instead of waking at 10 Hz -
+        # the display only needs per-second updates. Sleep in 0.5 s slices
+        # so a long-press update request is still picked up promptly.
+        delay_ms = 1000 - (time.ticks_ms() % 1000)
+        while delay_ms > 0 and not _SW_STATE[2]:
+            step = 500 if delay_ms > 500 else delay_ms
+            time.sleep_ms(step)
+            delay_ms -= step
     
 # === Main Program - Connnect to Wifi or goto AP mode Wifi setup ===
 # ===                If Wifi connection OK, go to Weather program ===
@@ -2310,6 +2420,13 @@ def application_mode(settings):
 try:
     print("=== Free memory at start of main code ===")
     test_free_memory()
+
+    # Default GC policy only collects when an allocation fails, which on
+    # the Pico leaves the heap badly fragmented by the time the TLS
+    # buffers are needed. Collect now and set the threshold to ~25% of
+    # free memory so boot-time string churn is swept preemptively.
+    gc.collect()
+    gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
     
     # See if setup wifi switch is pressed
     if setup_sw.value() == False:
@@ -2326,14 +2443,11 @@ try:
     status, settings, reason = load_settings()
     if status in ("missing", "invalid", "corrupt"):
         # Display reason for error in settings
-        display.fill(color565(0, 0, 0))
+        display.fill(BLACK)
         center_lgtext("Settings Error", 60)
         center_smtext(reason, 80)
         center_smtext("Entering Setup Mode", 120)
-        for count in range(5,0, -1):   # Count down from 5 to 1
-            display.fill_rect(0, 140, 240, 16, color565(0, 0, 0))  # Clears 1 text line
-            center_smtext(f"in {count} seconds", 140)
-            time.sleep(1)
+        countdown_seconds(5, 140)
         print(f"Settings status = {status}. Reason: {reason}. Entering setup mode")
         setup_mode()
         server.run()
@@ -2341,56 +2455,111 @@ try:
     else:
         print("Settings loaded successfully.")
       
-    # Settings files loaded OK, start up  
+    # Pull the settings fields used below out of the dict once - the
+    # connect block subscripts settings['ssid'] half a dozen times and
+    # each lookup is a hash + probe per use
+    ssid = settings["ssid"]
+    password = settings["password"]
+    zipc = settings["zip"]
+
+    # Kick off the Wi-Fi association before drawing the logo: the radio
+    # negotiates in the background while the SPI bus is busy with the
+    # logo, hiding most of the connect latency inside the 3 s logo hold
+    wlan = network.WLAN(network.STA_IF)
+    wlan.active(True)
+    wlan.connect(ssid, password)
+
+    # Settings files loaded OK, start up
     # Display P&L Logo
     print("Displaying logo")
-    display.fill(rgb888_to_rgb565(255, 254, 140))
+    display.fill(CREAM)
 
-    image_path = "/icons/pl_logo_sparse_gryscl.raw"
-    draw_sparse_grayscale(display, image_path)
+    # Prefer the RLE-packed logo when it is on the flash: one sequential
+    # pass over compressed runs with row-batched blits, instead of a
+    # display.pixel call per sparse record
+    try:
+        draw_rle_image(display, "/icons/pl_logo.rle")
+    except OSError:
+        draw_sparse_grayscale(display, "/icons/pl_logo_sparse_gryscl.raw")
+
+    # Preload weather icons into RAM while the logo is on screen
+    preload_icon_cache()
+
+    # Keep the logo up for the rest of its 3 s budget, but stop waiting
+    # as soon as the association completes
+    logo_deadline = time.ticks_add(time.ticks_ms(), 3000)
+    while time.ticks_diff(logo_deadline, time.ticks_ms()) > 0 and not wlan.isconnected():
+        time.sleep_ms(100)
+
+    # Sweep up the logo-draw and icon-preload garbage before the Wi-Fi
+    # stack needs room for its (large) TLS and socket buffers
+    gc.collect()
 
-    time.sleep(3)
-    
     # Try to connect to Wifi
+    # The info-screen lines built from settings are loop-invariant: format
+    # them once here instead of allocating fresh strings on every retry
+    ver_line = "v" + __version__
+    ssid_line = "WiFi SSID: " + ssid
+    zip_line = "Zip Code: " + zipc
+    # The connecting screen is identical across retries: draw it once
+    # and let the loop repaint only the small attempt line under it
+    display.fill(BLACK)
+    center_smtext("Connecting to", 40, LBLUE)
+    center_smtext("WiFi Network SSID:", 60, LBLUE)
+    center_lgtext(ssid, 100, YELLOW)
     wifi_current_attempt = 1
     while (wifi_current_attempt < WIFI_MAX_ATTEMPTS):
-        print(settings['ssid'])
-        print(settings['password'])
-        print(settings['zip'])
-        print(f"Connecting to wifi {settings['ssid']} attempt [{wifi_current_attempt}]")
-        
-        display.fill(color565(0, 0, 0))
-        center_smtext("Connecting to", 40, color565(173, 216, 230))
-        center_smtext("WiFi Network SSID:", 60, color565(173, 216, 230))
-        center_lgtext(f"{settings['ssid']}", 100, color565(255, 255, 0))
-        ip_address = connect_to_wifi(settings["ssid"], settings["password"])
+        # USB-CDC prints block until the host drains, so keep the
+        # per-attempt chatter out of the loop unless debugging - the
+        # const() gate lets the compiler drop the block entirely
+        if DEBUG:
+            print(ssid)
+            print(password)
+            print(zipc)
+            print(f"Connecting to wifi {ssid} attempt [{wifi_current_attempt}]")
+
+        if wifi_current_attempt > 1:
+            display.fill_rect(0, 140, 240, 16, BLACK)
+            center_smtext(f"attempt {wifi_current_attempt}", 140, LBLUE)
+        if wlan.isconnected():
+            # Association already finished during the logo hold
+            ip_address = wlan.ifconfig()[0]
+        else:
+            ip_address = connect_to_wifi(ssid, password)
         if is_connected_to_wifi():
             print(f"Connected to wifi, IP address {ip_address}")
                 
-            display.fill(color565(0, 0, 0))
-            center_lgtext("Peony & Lemon",60, color565(255, 254, 140))
-            center_lgtext("Forecaster",80, color565(255, 254, 140))
-            center_smtext(f"v{__version__}",100)
-            center_smtext("Connected:", 120, color565(173, 216, 230))
-            center_smtext(f"WiFi SSID: {settings['ssid']}", 140, color565(173, 216, 230))
-            center_smtext(f"This IP: {ip_address}", 160, color565(173, 216, 230))
-            center_smtext(f"Zip Code: {settings['zip']}", 180)
+            display.fill(BLACK)
+            center_lgtext("Peony & Lemon",60, CREAM)
+            center_lgtext("Forecaster",80, CREAM)
+            center_smtext(ver_line,100)
+            center_smtext("Connected:", 120, LBLUE)
+            center_smtext(ssid_line, 140, LBLUE)
+            center_smtext("This IP: " + ip_address, 160, LBLUE)
+            center_smtext(zip_line, 180)
 
             time.sleep(1)
+            # Connected-screen churn collected before the geocode/NWS
+            # requests start allocating
+            gc.collect()
             break
         
         else:
             wifi_current_attempt += 1
                 
     if is_connected_to_wifi():
-#        zip_code = settings["zip"]
-#        application_mode(zip_code)
-        if not settings.get("lat") or not settings.get("lon"):
-            zip_code = settings.get("zip", "").strip()
-            lat, lon, reason = get_lat_lon(zip_code)
+        # Re-geocode only when the zip the cached lat/lon was looked up for
+        # has changed (or was never recorded). Checking "lat" presence
+        # alone isn't enough: changing the zip in setup mode would leave
+        # stale coordinates behind. Setups configured with manual lat/lon
+        # have no zip at all - never geocode those unless the coordinates
+        # themselves are missing.
+        if (zipc and settings.get("lat_for_zip") != zipc) or not settings.get("lat") or not settings.get("lon"):
+            lat, lon, reason = get_lat_lon(zipc.strip())
             if lat is not None and lon is not None:
                 settings["lat"] = lat
                 settings["lon"] = lon
+                settings["lat_for_zip"] = zipc
                 save_settings(settings)
             else:
                 print("Lat/lon lookup failed:", reason)
@@ -2400,10 +2569,7 @@ try:
                 center_lgtext("Location Error", 80)
                 center_smtext(reason, 100)
                 center_smtext("Going to Setup Mode", 120)
-                for count in range(5,0, -1):   # Count down from 5 to 1
-                    display.fill_rect(0, 140, 240, 16, color565(0, 0, 0))  # Clears 1 text line
-                    center_smtext(f"in {count} seconds", 160)
-                    time.sleep(1)
+                countdown_seconds(5, 160)
 
                 setup_mode()
                 server.run()
@@ -2419,29 +2585,27 @@ try:
         msg = f"Error (Code: {status})"
             
         # Display Wifi connect failed message and error
-        display.fill(color565(0, 0, 0))
+        display.fill(BLACK)
         center_smtext("WiFi Connect Failed:", 80)
         center_smtext(msg,100)
         center_smtext("Going to Setup", 120)
-        for count in range(5,0, -1):   # Count down from 5 to 1
-            display.fill_rect(0, 140, 240, 16, color565(0, 0, 0))  # Clears 1 text line
-            center_smtext(f"in {count} seconds", 140)
-            time.sleep(1)
+        countdown_seconds(5, 140)
         #Print wifi connect error to console
         print(f"Wifi connect failed {msg}")
-        # Log wifi connect error to log file
-#         logging.error(f"Wi-Fi connect failed: {msg} (status code: {status})")
         print("Going to setup mode due to Wi-Fi failure.")
         setup_mode()
         server.run()
 
 except Exception as e:
-    # Log the error
-    buf = uio.StringIO()
-    sys.print_exception(e, buf)
-#     logging.exception(buf.getvalue())
-    
-#     logging.info("Restarting device in 2 seconds...")
+    # Stream the traceback straight into the log file - no StringIO, no
+    # getvalue() copy. If we got here because the heap is exhausted,
+    # those in-memory buffers are exactly what would fail to allocate
+    try:
+        with open("error.log", "a") as f:
+            sys.print_exception(e, f)
+            f.write("\nRestarting\n")
+    except OSError:
+        sys.print_exception(e)
     time.sleep(2)
     machine.reset()
     
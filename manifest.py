@@ -0,0 +1,17 @@
+# Frozen-module manifest for baking the application into a custom
+# MicroPython firmware image. Frozen bytecode executes from flash (XIP)
+# instead of being compiled onto the GC heap at import, which frees
+# several KB of RAM before connect_to_wifi() needs it for TLS buffers.
+#
+# Build from the micropython source tree:
+#
+#     cd ports/rp2
+#     make BOARD=RPI_PICO_W FROZEN_MANIFEST=/path/to/this/manifest.py
+#
+# Keep a one-line main.py on the device that just does `import main_app`.
+include("$(PORT_DIR)/boards/manifest.py")
+
+freeze(".", ("main_app.py", "display_helpers.py"))
+# The full phew package (logging, template, dns, ...) lives on the device;
+# add its modules here too when building from a tree that has them all.
+freeze(".", "phew/server.py")